@@ -3,7 +3,7 @@ Base client class for the MD Python client
 """
 
 import os
-from typing import Any, Optional
+from typing import Any, Optional, TypeVar
 
 import requests
 from dotenv import load_dotenv
@@ -12,6 +12,8 @@ load_dotenv()
 
 DEFAULT_BASE_URL = "https://app.massdynamics.com/api"
 
+_ClientT = TypeVar("_ClientT", bound="BaseMDClient")
+
 
 class BaseMDClient:
     """Base client with shared auth, base URL, and HTTP transport"""
@@ -30,6 +32,9 @@ class BaseMDClient:
 
         self.base_url: str = base
         self.api_token: str = token
+        # One pooled session keeps connections alive across repeated calls
+        # such as wait_until_complete polls
+        self._session = requests.Session()
 
     def _get_headers(self) -> dict:
         """Get common headers for API requests"""
@@ -53,6 +58,16 @@ class BaseMDClient:
         if headers:
             request_headers.update(headers)
 
-        return requests.request(
+        return self._session.request(
             method, url, headers=request_headers, json=json, **kwargs
         )
+
+    def close(self) -> None:
+        """Close the pooled HTTP session and release its connections"""
+        self._session.close()
+
+    def __enter__(self: _ClientT) -> _ClientT:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
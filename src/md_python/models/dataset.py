@@ -4,12 +4,19 @@ Dataset model for create, update, and retrieval operations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional
 from uuid import UUID
 
 from pydantic.dataclasses import dataclass as pydantic_dataclass
 
 
+@lru_cache(maxsize=4096)
+def _parse_uuid(value: str) -> UUID:
+    """Parse a UUID string, memoized as the same IDs recur across polls"""
+    return UUID(value)
+
+
 @pydantic_dataclass
 @dataclass
 class Dataset:
@@ -78,8 +85,10 @@ class Dataset:
         job_run_start_time = cls._parse_iso_datetime(data.get("job_run_start_time"))
 
         return cls(
-            id=UUID(data.get("id")) if data.get("id") else None,
-            input_dataset_ids=[UUID(did) for did in data.get("input_dataset_ids", [])],
+            id=_parse_uuid(data["id"]) if data.get("id") else None,
+            input_dataset_ids=[
+                _parse_uuid(did) for did in data.get("input_dataset_ids", [])
+            ],
             name=data.get("name", ""),
             job_slug=data.get("job_slug", ""),
             sample_names=data.get("sample_names"),
@@ -89,3 +98,18 @@ class Dataset:
             job_run_start_time=job_run_start_time,
             error_message=data.get("error_message"),
         )
+
+
+class DatasetState(NamedTuple):
+    """Dataset ID and state only, used when polling many datasets"""
+
+    id: Optional[UUID]
+    state: Optional[str]
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "DatasetState":
+        """Create DatasetState from a dataset JSON object, ignoring other fields"""
+        return cls(
+            id=_parse_uuid(data["id"]) if data.get("id") else None,
+            state=data.get("state"),
+        )
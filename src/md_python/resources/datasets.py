@@ -2,20 +2,85 @@
 Datasets resource for the MD Python client
 """
 
+import copy
+import random
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+from uuid import UUID
 
-from ..models import Dataset
+import requests
+
+from ..models import Dataset, DatasetState
 
 if TYPE_CHECKING:
     from ..base_client import BaseMDClient
 
+_TERMINAL_OK = frozenset({"COMPLETED"})
+_TERMINAL_FAIL = frozenset({"FAILED", "ERROR", "CANCELLED"})
+_CACHE_TTL_S = 300
+_CACHE_MAX_ENTRIES = 128
+
+
+def _parse_dataset_id(dataset_id: Any) -> Optional[UUID]:
+    """Parse a dataset ID once up front so polls compare UUIDs directly"""
+    if isinstance(dataset_id, UUID):
+        return dataset_id
+    try:
+        return UUID(str(dataset_id))
+    except ValueError:
+        return None
+
+
+def _sleep_until_next_poll(deadline: float, delay: float, jitter: float) -> bool:
+    """Sleep for delay, clamped to the deadline. Returns False once it has passed.
+
+    The delay is scaled by a random factor in [1 - jitter, 1 + jitter] so that
+    clients started together do not keep polling in lockstep.
+    """
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        return False
+    if jitter:
+        delay *= 1 - jitter + 2 * jitter * random.random()
+    time.sleep(min(delay, remaining))
+    return True
+
 
 class Datasets:
     """Datasets resource"""
 
     def __init__(self, client: "BaseMDClient"):
         self._client = client
+        self._initial_ds_cache: Dict[str, Tuple[float, Dataset]] = {}
+
+    def _cache_initial_dataset(self, experiment_id: str, dataset: Dataset) -> None:
+        """Store a copy of an initial dataset, evicting expired and oldest entries"""
+        now = time.monotonic()
+        cache = self._initial_ds_cache
+        cache.pop(experiment_id, None)
+        # entries stay in insertion order, so the oldest is always first
+        while cache and (
+            len(cache) >= _CACHE_MAX_ENTRIES
+            or now - next(iter(cache.values()))[0] >= _CACHE_TTL_S
+        ):
+            del cache[next(iter(cache))]
+        cache[experiment_id] = (now, copy.deepcopy(dataset))
+
+    def invalidate_experiment(self, experiment_id: str) -> None:
+        """Drop the cached initial dataset of an experiment so it is refetched"""
+        self._initial_ds_cache.pop(experiment_id, None)
+
+    def clear_cache(self) -> None:
+        """Drop all cached initial datasets"""
+        self._initial_ds_cache.clear()
 
     def create(self, dataset: Dataset) -> str:
         """Create a new dataset using Dataset model"""
@@ -52,28 +117,60 @@ class Datasets:
                 f"Failed to create dataset: {response.status_code} - {response.text}"
             )
 
-    def list_by_experiment(self, experiment_id: str) -> List[Dataset]:
-        """Get datasets belonging to an experiment, returns list of Dataset objects"""
+    def _list_rows_by_experiment(
+        self, experiment_id: str, params: Optional[Dict[str, str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch the raw dataset rows of an experiment, raising on failure"""
+        # unfiltered calls send the same request as before filters existed
+        request_kwargs: Dict[str, Any] = {"params": params} if params else {}
 
         response = self._client._make_request(
             method="GET",
             endpoint=f"/datasets?experiment_id={experiment_id}",
             headers={"accept": "application/vnd.md-v1+json"},
+            **request_kwargs,
         )
 
-        if response.status_code == 200:
-            datasets_data = response.json()
-
-            datasets = []
-            for dataset_data in datasets_data:
-                dataset = Dataset.from_json(dataset_data)
-                datasets.append(dataset)
-
-            return datasets
-        else:
+        if response.status_code != 200:
             raise Exception(
                 f"Failed to get datasets by experiment: {response.status_code} - {response.text}"
             )
+        rows: List[Dict[str, Any]] = response.json()
+        return rows
+
+    def list_by_experiment(
+        self,
+        experiment_id: str,
+        type: Optional[str] = None,
+        state: Optional[str] = None,
+    ) -> List[Dataset]:
+        """Get datasets belonging to an experiment, returns list of Dataset objects
+
+        Optional type and state filters are passed to the API so only matching
+        datasets are returned.
+        """
+
+        params = {}
+        if type is not None:
+            params["type"] = type
+        if state is not None:
+            params["state"] = state
+
+        return [
+            Dataset.from_json(dataset_data)
+            for dataset_data in self._list_rows_by_experiment(experiment_id, params)
+        ]
+
+    def iter_states_by_experiment(self, experiment_id: str) -> Iterator[DatasetState]:
+        """Yield the ID and state of each dataset belonging to an experiment
+
+        Cheaper than list_by_experiment when polling, as no Dataset models are
+        validated. Each DatasetState is only built when requested, so callers
+        that stop early skip the rest. The body is read in full so the pooled
+        connection can be reused.
+        """
+        for data in self._list_rows_by_experiment(experiment_id):
+            yield DatasetState.from_json(data)
 
     def get_by_id(self, dataset_id: str) -> Optional[Dataset]:
         """Get a single dataset by ID. Returns None if not found or on 404."""
@@ -150,35 +247,43 @@ class Datasets:
         dataset_id: str,
         poll_s: int = 5,
         timeout_s: int = 1800,
+        max_poll_s: float = 30,
+        jitter: float = 0.5,
     ) -> Dataset:
         """Poll the dataset until it reaches a terminal state.
 
         Tries to fetch the dataset by ID (GET /datasets/{id}); falls back to
         list_by_experiment if get_by_id is not available or returns 404.
+        The wait between polls starts at poll_s and doubles after every
+        non-terminal poll, capped at max_poll_s, and is randomised by +/- jitter
+        (a fraction from 0 to 1; 0 disables it). Network errors are raised
+        straight away rather than retried.
         Returns the Dataset when terminal, or raises TimeoutError on timeout.
         Terminal states: COMPLETED, FAILED, ERROR, CANCELLED.
         """
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
         experiment_id_str = str(experiment_id)
         dataset_id_str = str(dataset_id)
-        end = time.monotonic() + timeout_s
+        target_id = _parse_dataset_id(dataset_id)
+        deadline = time.monotonic() + timeout_s
+        delay: float = min(poll_s, max_poll_s)
         last: Optional[str] = None
         use_get_by_id = hasattr(self, "get_by_id")
 
-        while time.monotonic() < end:
+        while True:
             ds = None
             if use_get_by_id:
                 try:
                     ds = self.get_by_id(dataset_id_str)
+                except requests.RequestException:
+                    raise
                 except Exception:
                     use_get_by_id = False
             if ds is None:
                 dds = self.list_by_experiment(experiment_id=experiment_id_str)
                 ds = next(
-                    (
-                        d
-                        for d in dds
-                        if d.id is not None and str(d.id) == dataset_id_str
-                    ),
+                    (d for d in dds if target_id is not None and d.id == target_id),
                     None,
                 )
             if ds:
@@ -189,19 +294,108 @@ class Datasets:
 
                 if state is not None:
                     state_upper = state.upper()
-                    if state_upper == "COMPLETED":
+                    if state_upper in _TERMINAL_OK:
                         return ds
-                    if state_upper in {"FAILED", "ERROR", "CANCELLED"}:
+                    if state_upper in _TERMINAL_FAIL:
                         raise Exception(f"Dataset {dataset_id_str} failed: {state}")
             else:
                 if last is None:
                     print("waiting for dataset to appear...")
-            time.sleep(poll_s)
+            if not _sleep_until_next_poll(deadline, delay, jitter):
+                break
+            delay = min(delay * 2, max_poll_s)
 
         raise TimeoutError(
             f"Dataset {dataset_id_str} not terminal within {timeout_s}s (last state={last})"
         )
 
+    def wait_many(
+        self,
+        experiment_id: str,
+        dataset_ids: List[str],
+        poll_s: int = 5,
+        timeout_s: int = 1800,
+        max_poll_s: float = 30,
+        jitter: float = 0.5,
+    ) -> Dict[str, Dataset]:
+        """Poll several datasets of one experiment until all reach a terminal state.
+
+        Each poll is a single iter_states_by_experiment call covering every
+        pending dataset, stopped once all of them have been seen, so
+        waiting on many datasets takes as long as the slowest one rather than
+        the sum of their run times. Full Dataset models are only fetched once,
+        after all have completed. Uses the same backoff as wait_until_complete
+        and likewise raises network errors straight away.
+        Dataset IDs must be UUIDs; a completed dataset missing from the final
+        list is fetched with get_by_id.
+        Returns a dict keyed by the dataset IDs as passed in, raises an
+        Exception naming every failed dataset, or raises TimeoutError on
+        timeout.
+        """
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
+        if not dataset_ids:
+            return {}
+
+        experiment_id_str = str(experiment_id)
+        # map parsed IDs back to the caller's strings, which may be unhyphenated
+        requested: Dict[UUID, str] = {}
+        for dataset_id in dataset_ids:
+            parsed = _parse_dataset_id(dataset_id)
+            if parsed is None:
+                raise ValueError(f"Dataset ID {dataset_id} is not a UUID")
+            requested[parsed] = str(dataset_id)
+        pending = set(requested)
+        failed: Dict[str, str] = {}
+        deadline = time.monotonic() + timeout_s
+        delay: float = min(poll_s, max_poll_s)
+
+        while True:
+            unseen = set(pending)
+            for ds_id, state in self.iter_states_by_experiment(experiment_id_str):
+                if ds_id not in unseen:
+                    continue
+                unseen.discard(ds_id)
+                state_upper = state.upper() if state else None
+                if state_upper in _TERMINAL_OK:
+                    pending.discard(ds_id)
+                elif state_upper in _TERMINAL_FAIL:
+                    failed[requested[ds_id]] = str(state)
+                    pending.discard(ds_id)
+                if not unseen:
+                    break  # every pending dataset seen; skip the rest
+
+            if not pending:
+                if failed:
+                    raise Exception(f"Datasets failed: {failed}")
+                return self._fetch_completed(experiment_id_str, requested)
+
+            if not _sleep_until_next_poll(deadline, delay, jitter):
+                break
+            delay = min(delay * 2, max_poll_s)
+
+        raise TimeoutError(
+            f"Datasets {sorted(requested[p] for p in pending)} not terminal "
+            f"within {timeout_s}s"
+        )
+
+    def _fetch_completed(
+        self, experiment_id: str, requested: Dict[UUID, str]
+    ) -> Dict[str, Dataset]:
+        """Fetch the full models of completed datasets, keyed by requested ID"""
+        listed = {
+            ds.id: ds
+            for ds in self.list_by_experiment(experiment_id=experiment_id)
+            if ds.id in requested
+        }
+        out: Dict[str, Dataset] = {}
+        for ds_id, dataset_id in requested.items():
+            ds = listed.get(ds_id) or self.get_by_id(dataset_id)
+            if ds is None:
+                raise Exception(f"Dataset {dataset_id} completed but was not found")
+            out[dataset_id] = ds
+        return out
+
     def find_initial_dataset(self, experiment_id: str) -> Optional[Dataset]:
         """Return the initial dataset for an experiment.
 
@@ -209,16 +403,27 @@ class Datasets:
         1) First dataset of type 'INTENSITY'
         2) Earliest by job_run_start_time
         3) First dataset if any
+
+        The result is cached per experiment for 5 minutes and returned as a
+        copy, so its state is as of the first lookup; use get_by_id for the
+        current state.
         """
-        datasets = self.list_by_experiment(experiment_id=experiment_id)
+        entry = self._initial_ds_cache.get(experiment_id)
+        if entry:
+            if time.monotonic() - entry[0] < _CACHE_TTL_S:
+                return copy.deepcopy(entry[1])
+            del self._initial_ds_cache[experiment_id]
+
+        datasets = self.list_by_experiment(
+            experiment_id=experiment_id, type="INTENSITY"
+        )
         exp = self._client.experiments.get_by_id(experiment_id)  # type: ignore[attr-defined]
         if exp is None:
             raise ValueError(f"Experiment {experiment_id} not found")
         experiment_name = exp.name
 
-        if not datasets:
-            raise ValueError(f"No datasets found for experiment {experiment_id}")
-
+        # the list is already filtered by type; filtering again guards against
+        # a server that ignores the parameter
         intensity = [d for d in datasets if getattr(d, "type", None) == "INTENSITY"]
         if not intensity:
             raise ValueError(
@@ -231,6 +436,7 @@ class Datasets:
                 f"Multiple intensity datasets found for experiment {experiment_id} with name {experiment_name}"
             )
         elif len(by_name) == 1:
+            self._cache_initial_dataset(experiment_id, by_name[0])
             return by_name[0]
         else:
             raise ValueError(
@@ -1,5 +1,8 @@
 import pytest
 
+from md_python.base_client import DEFAULT_BASE_URL
+from md_python.client_v1 import MDClientV1
+
 
 @pytest.fixture(autouse=True)
 def _mock_env_for_client(monkeypatch):
@@ -10,3 +13,19 @@ def _mock_env_for_client(monkeypatch):
     """
     monkeypatch.setenv("MD_API_BASE_URL", "https://app.massdynamics.com/api")
     monkeypatch.delenv("MD_AUTH_TOKEN", raising=False)
+
+
+@pytest.fixture(scope="session")
+def api_token():
+    return "test_token_123"
+
+
+@pytest.fixture(scope="session")
+def md_client(api_token):
+    """MDClientV1 built once per session
+
+    The base URL is passed explicitly because session fixtures are set up
+    before the environment above is patched. Copy the client before
+    reassigning its attributes.
+    """
+    return MDClientV1(api_token, base_url=DEFAULT_BASE_URL)
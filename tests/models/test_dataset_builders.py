@@ -1,5 +1,8 @@
+from unittest.mock import Mock
 from uuid import UUID
 
+import pytest
+
 from md_python.models import SampleMetadata
 from md_python.models.dataset_builders import (
     DoseResponseDataset,
@@ -8,10 +11,23 @@ from md_python.models.dataset_builders import (
     PairwiseComparisonDataset,
 )
 
+_ID0, _ID1, _ID2, _ID3, _ID4 = (str(UUID(int=i)) for i in range(5))
+_SAMPLE_METADATA = SampleMetadata(data=[["group"], ["a"], ["b"]])
+
+# built once on import; the builders only call client.datasets.create
+_CLIENT = Mock()
+
 
-def test_dose_response_dataset_build_and_run(mocker):
+@pytest.fixture
+def fake_client():
+    """Client stand-in whose datasets.create return value each test sets"""
+    _CLIENT.reset_mock(return_value=True, side_effect=True)
+    return _CLIENT
+
+
+def test_dose_response_dataset_build_and_run(fake_client):
     drc = DoseResponseDataset(
-        input_dataset_ids=[str(UUID(int=4))],
+        input_dataset_ids=[_ID4],
         dataset_name="Test doseresponse dataset",
         sample_names=["1", "2", "3", "4", "5", "6"],
         control_samples=["1", "3"],
@@ -30,19 +46,16 @@ def test_dose_response_dataset_build_and_run(mocker):
     assert ds.job_run_params["normalise"] == "none"
     assert ds.job_run_params["prop_required_in_protein"] == 0.5
 
-    client = mocker.Mock()
-    client.datasets = mocker.Mock()
-    client.datasets.create.return_value = "drc-id"
-    out = drc.run(client)
+    fake_client.datasets.create.return_value = "drc-id"
+    out = drc.run(fake_client)
     assert out == "drc-id"
 
 
-def test_pairwise_comparison_dataset_class_build_and_run(mocker):
-    sm = SampleMetadata(data=[["group"], ["a"], ["b"]])
+def test_pairwise_comparison_dataset_class_build_and_run(fake_client):
     pw = PairwiseComparisonDataset(
-        input_dataset_ids=[str(UUID(int=1))],
+        input_dataset_ids=[_ID1],
         dataset_name="Pairwise",
-        sample_metadata=sm,
+        sample_metadata=_SAMPLE_METADATA,
         condition_column="group",
         condition_comparisons=[["a", "b"]],
         # filter_values_criteria={"method": "percentage", "filter_threshold_percentage": 0.5},
@@ -50,26 +63,22 @@ def test_pairwise_comparison_dataset_class_build_and_run(mocker):
     ds = pw.to_dataset()
     assert ds.name == "Pairwise"
 
-    client = mocker.Mock()
-    client.datasets = mocker.Mock()
-    client.datasets.create.return_value = "new-id"
-    out = pw.run(client)
+    fake_client.datasets.create.return_value = "new-id"
+    out = pw.run(fake_client)
     assert out == "new-id"
 
 
-def test_minimal_dataset_build_and_run(mocker):
+def test_minimal_dataset_build_and_run(fake_client):
     md = MinimalDataset(
-        input_dataset_ids=[str(UUID(int=2))],
+        input_dataset_ids=[_ID2],
         dataset_name="Min DS",
         job_slug="demo_flow",
     )
     ds = md.to_dataset()
     assert ds.name == "Min DS"
     assert ds.job_slug == "demo_flow"
-    client = mocker.Mock()
-    client.datasets = mocker.Mock()
-    client.datasets.create.return_value = "min-id"
-    out = md.run(client)
+    fake_client.datasets.create.return_value = "min-id"
+    out = md.run(fake_client)
     assert out == "min-id"
 
 
@@ -115,7 +124,7 @@ def test_builders_validation_errors():
 
     # DoseResponseDataset validation: control_samples must be subset of sample_names
     drc = DoseResponseDataset(
-        input_dataset_ids=[str(UUID(int=0))],
+        input_dataset_ids=[_ID0],
         dataset_name="DRC",
         sample_names=["a", "b"],
         control_samples=["c"],
@@ -140,9 +149,9 @@ def test_builders_validation_errors():
         assert any(k in str(e) for k in ["input_dataset_ids", "dataset_name"])
 
 
-def test_normalisation_imputation_builder_build_and_run(mocker):
+def test_normalisation_imputation_builder_build_and_run(fake_client):
     ni = NormalisationImputationDataset(
-        input_dataset_ids=[str(UUID(int=3))],
+        input_dataset_ids=[_ID3],
         dataset_name="NI DS",
         normalisation_method="quantile",
         imputation_method="mnar",
@@ -163,17 +172,15 @@ def test_normalisation_imputation_builder_build_and_run(mocker):
     assert "filtration_methods_peptide" not in ds.job_run_params
     assert "filtration_methods_gene" not in ds.job_run_params
 
-    client = mocker.Mock()
-    client.datasets = mocker.Mock()
-    client.datasets.create.return_value = "new-id"
-    out = ni.run(client)
+    fake_client.datasets.create.return_value = "new-id"
+    out = ni.run(fake_client)
     assert out == "new-id"
 
 
 def test_normalisation_imputation_builder_gene_entity_canonical_aliases():
     """Legacy underscored 'minimum_abundance' is accepted and emitted as canonical."""
     ni = NormalisationImputationDataset(
-        input_dataset_ids=[str(UUID(int=4))],
+        input_dataset_ids=[_ID4],
         dataset_name="NI gene",
         entity_type="gene",
         normalisation_method="cpm",
@@ -207,7 +214,7 @@ def _design():
 def test_ni_protein_combat_emits_combat_keys():
     """NI-A: protein + combat technique emits combat-specific keys."""
     ni = NormalisationImputationDataset(
-        input_dataset_ids=[str(UUID(int=1))],
+        input_dataset_ids=[_ID1],
         dataset_name="combat protein",
         entity_type="protein",
         normalisation_method="batch correction",
@@ -234,7 +241,7 @@ def test_ni_protein_combat_emits_combat_keys():
 def test_ni_protein_limma_emits_limma_keys():
     """NI-B: protein + limma technique emits batch_variables (no combat keys)."""
     ni = NormalisationImputationDataset(
-        input_dataset_ids=[str(UUID(int=1))],
+        input_dataset_ids=[_ID1],
         dataset_name="limma protein",
         entity_type="protein",
         normalisation_method="batch correction",
@@ -256,7 +263,7 @@ def test_ni_protein_limma_emits_limma_keys():
 def test_ni_gene_combat_seq_emits_combat_seq():
     """NI-C: gene + combat seq technique."""
     ni = NormalisationImputationDataset(
-        input_dataset_ids=[str(UUID(int=1))],
+        input_dataset_ids=[_ID1],
         dataset_name="combat seq gene",
         entity_type="gene",
         normalisation_method="batch correction",
@@ -277,7 +284,7 @@ def test_ni_gene_combat_seq_emits_combat_seq():
 def test_ni_protein_filtration_by_missing_values():
     """NI-D: protein filtration via 'by missing values' (newly unblocked)."""
     ni = NormalisationImputationDataset(
-        input_dataset_ids=[str(UUID(int=1))],
+        input_dataset_ids=[_ID1],
         dataset_name="protein filt",
         entity_type="protein",
         normalisation_method="skip",
@@ -302,7 +309,7 @@ def test_ni_protein_filtration_by_missing_values():
 def test_ni_peptide_filtration_by_missing_values_count_logic():
     """NI-E: peptide filtration via 'by missing values' with count criteria."""
     ni = NormalisationImputationDataset(
-        input_dataset_ids=[str(UUID(int=1))],
+        input_dataset_ids=[_ID1],
         dataset_name="peptide filt count",
         entity_type="peptide",
         normalisation_method="skip",
@@ -324,7 +331,7 @@ def test_ni_peptide_filtration_by_missing_values_count_logic():
 def test_ni_peptide_filtration_ptm_threshold():
     """NI-F: peptide + by ptm localization probability emits threshold."""
     ni = NormalisationImputationDataset(
-        input_dataset_ids=[str(UUID(int=1))],
+        input_dataset_ids=[_ID1],
         dataset_name="peptide PTM",
         entity_type="peptide",
         normalisation_method="skip",
@@ -341,7 +348,7 @@ def test_ni_peptide_filtration_ptm_threshold():
 def test_ni_imputation_knn_tn_emits_flat_keys():
     """NI-G: knn_tn imputation method emits flat keys."""
     ni = NormalisationImputationDataset(
-        input_dataset_ids=[str(UUID(int=1))],
+        input_dataset_ids=[_ID1],
         dataset_name="knn_tn",
         normalisation_method="skip",
         imputation_method="knn_tn",
@@ -358,7 +365,7 @@ def test_ni_imputation_knn_tn_emits_flat_keys():
 def test_ni_imputation_knn_tn_defaults_applied():
     """NI-G': knn_tn with no overrides applies the converter defaults."""
     ni = NormalisationImputationDataset(
-        input_dataset_ids=[str(UUID(int=1))],
+        input_dataset_ids=[_ID1],
         dataset_name="knn_tn defaults",
         normalisation_method="skip",
         imputation_method="knn_tn",
@@ -371,7 +378,7 @@ def test_ni_imputation_knn_tn_defaults_applied():
 def test_ni_imputation_mindet_q():
     """NI-H: mindet imputation emits q."""
     ni = NormalisationImputationDataset(
-        input_dataset_ids=[str(UUID(int=1))],
+        input_dataset_ids=[_ID1],
         dataset_name="mindet",
         normalisation_method="skip",
         imputation_method="mindet",
@@ -386,7 +393,7 @@ def test_ni_imputation_mindet_q():
 def test_ni_normalisation_median_centre_at_zero_default_true():
     """NI-I: median_normalisation_centre_at_zero defaults to True; override round-trips."""
     ni_default = NormalisationImputationDataset(
-        input_dataset_ids=[str(UUID(int=1))],
+        input_dataset_ids=[_ID1],
         dataset_name="median default",
         normalisation_method="median",
         imputation_method="skip",
@@ -396,7 +403,7 @@ def test_ni_normalisation_median_centre_at_zero_default_true():
     assert p["include_imputed_values"] is False
 
     ni_off = NormalisationImputationDataset(
-        input_dataset_ids=[str(UUID(int=1))],
+        input_dataset_ids=[_ID1],
         dataset_name="median off",
         normalisation_method="median",
         imputation_method="skip",
@@ -410,7 +417,7 @@ def test_ni_normalisation_include_imputed_values_default_false():
     """NI-J: include_imputed_values defaults to False on median/quantile/sum/batch correction."""
     for method in ("median", "quantile", "sum"):
         ni = NormalisationImputationDataset(
-            input_dataset_ids=[str(UUID(int=1))],
+            input_dataset_ids=[_ID1],
             dataset_name=f"iv {method}",
             normalisation_method=method,
             imputation_method="skip",
@@ -419,7 +426,7 @@ def test_ni_normalisation_include_imputed_values_default_false():
         assert p["include_imputed_values"] is False, method
 
     ni_bc = NormalisationImputationDataset(
-        input_dataset_ids=[str(UUID(int=1))],
+        input_dataset_ids=[_ID1],
         dataset_name="iv bc",
         normalisation_method="batch correction",
         imputation_method="skip",
@@ -433,7 +440,7 @@ def test_ni_normalisation_include_imputed_values_default_false():
 def test_ni_filter_only_classmethod_runs():
     """NI-K: filter_only sets normalisation/imputation to skip and runs."""
     ni = NormalisationImputationDataset.filter_only(
-        input_dataset_ids=[str(UUID(int=1))],
+        input_dataset_ids=[_ID1],
         dataset_name="filter only",
         entity_type="protein",
         filtration_method="by missing values",
@@ -453,7 +460,7 @@ def test_ni_filter_only_classmethod_runs():
 def test_ni_batch_correction_requires_technique():
     """NI-L: batch correction without technique raises."""
     ni = NormalisationImputationDataset(
-        input_dataset_ids=[str(UUID(int=1))],
+        input_dataset_ids=[_ID1],
         dataset_name="bc no tech",
         normalisation_method="batch correction",
         imputation_method="skip",
@@ -469,7 +476,7 @@ def test_ni_batch_correction_requires_technique():
 def test_ni_combat_requires_batch_variable_combat():
     """NI-M: combat without batch_variable_combat raises."""
     ni = NormalisationImputationDataset(
-        input_dataset_ids=[str(UUID(int=1))],
+        input_dataset_ids=[_ID1],
         dataset_name="combat no var",
         normalisation_method="batch correction",
         imputation_method="skip",
@@ -486,7 +493,7 @@ def test_ni_combat_requires_batch_variable_combat():
 def test_ni_limma_requires_batch_variables():
     """NI-N: limma without batch_variables raises."""
     ni = NormalisationImputationDataset(
-        input_dataset_ids=[str(UUID(int=1))],
+        input_dataset_ids=[_ID1],
         dataset_name="limma no vars",
         normalisation_method="batch correction",
         imputation_method="skip",
@@ -503,7 +510,7 @@ def test_ni_limma_requires_batch_variables():
 def test_ni_filtration_by_missing_values_requires_criteria():
     """NI-O: by missing values without criteria raises."""
     ni = NormalisationImputationDataset(
-        input_dataset_ids=[str(UUID(int=1))],
+        input_dataset_ids=[_ID1],
         dataset_name="missing no crit",
         entity_type="protein",
         normalisation_method="skip",
@@ -521,7 +528,7 @@ def test_ni_filtration_by_missing_values_requires_criteria():
 def test_ni_filtration_by_missing_values_rejected_for_gene():
     """NI-P: by missing values is not allowed for gene."""
     ni = NormalisationImputationDataset(
-        input_dataset_ids=[str(UUID(int=1))],
+        input_dataset_ids=[_ID1],
         dataset_name="missing on gene",
         entity_type="gene",
         normalisation_method="skip",
@@ -538,7 +545,7 @@ def test_ni_filtration_by_missing_values_rejected_for_gene():
 def test_ni_filtration_minimum_abundance_rejected_for_protein():
     """NI-Q: by minimum abundance is not allowed for protein."""
     ni = NormalisationImputationDataset(
-        input_dataset_ids=[str(UUID(int=1))],
+        input_dataset_ids=[_ID1],
         dataset_name="min abundance on protein",
         entity_type="protein",
         normalisation_method="skip",
@@ -555,7 +562,7 @@ def test_ni_filtration_minimum_abundance_rejected_for_protein():
 def test_ni_legacy_underscore_aliases_normalised():
     """NI-R: underscored values are accepted on input and emitted as canonical."""
     ni = NormalisationImputationDataset(
-        input_dataset_ids=[str(UUID(int=1))],
+        input_dataset_ids=[_ID1],
         dataset_name="legacy aliases",
         entity_type="peptide",
         normalisation_method="batch_correction",
@@ -576,7 +583,7 @@ def test_ni_legacy_underscore_aliases_normalised():
 def test_ni_extra_params_overrides_typed_field():
     """NI-S: extra_params merged last, so caller can override any typed value."""
     ni = NormalisationImputationDataset(
-        input_dataset_ids=[str(UUID(int=1))],
+        input_dataset_ids=[_ID1],
         dataset_name="override",
         normalisation_method="skip",
         imputation_method="mnar",
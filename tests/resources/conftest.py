@@ -0,0 +1,35 @@
+import pytest
+
+from md_python.client import MDClientV1 as MDClient
+from md_python.resources.experiments import Experiments
+
+
+@pytest.fixture(scope="session")
+def _base_mock_client(session_mocker):
+    # spec a real instance so the health/experiments/datasets resources wired
+    # up in __init__ are part of the spec; spec_set rejects unknown attributes
+    client = MDClient(api_token="test_token", base_url="https://example.test/api")
+    return session_mocker.create_autospec(client, spec_set=True)
+
+
+@pytest.fixture
+def mock_client(_base_mock_client):
+    """Create a mock MDClient for testing"""
+    # autospec introspection happens once per session and the mock is shared
+    # by every resource test; only configured return values and side effects
+    # are reset between tests
+    _base_mock_client.reset_mock(return_value=True, side_effect=True)
+    return _base_mock_client
+
+
+@pytest.fixture(scope="session")
+def _base_experiments_resource(_base_mock_client):
+    return Experiments(_base_mock_client)
+
+
+@pytest.fixture
+def experiments_resource(_base_experiments_resource, mock_client):
+    """Create Experiments resource instance with mock client"""
+    # Experiments only holds a reference to the client, so one instance is
+    # shared; depending on mock_client resets the client before each test
+    return _base_experiments_resource
@@ -2,25 +2,67 @@
 Test cases for Datasets resource
 """
 
-from unittest.mock import Mock
+from types import SimpleNamespace
 from uuid import UUID
 
 import pytest
 
-from md_python.client import MDClientV1 as MDClient
-from md_python.models import Dataset
+from md_python.models import Dataset, DatasetState
 from md_python.resources.datasets import Datasets
 
+_UUID_A = UUID("2b1a5c27-ac95-456c-b2ff-eccfb3ab3d1e")
+_UUID_B = UUID("3c2b6d38-bd06-567d-c3ff-fddff4bc4e2f")
+_UUID_C = UUID("4d3c7e49-ce17-678e-d4ff-feeff5cd5f3f")
+
+_LIST_ROW_1 = {
+    "id": "a1b2c3d4e5f67890a1b2c3d4e5f67890",
+    "input_dataset_ids": ["2b1a5c27-ac95-456c-b2ff-eccfb3ab3d1e"],
+    "name": "Dataset 1",
+    "job_slug": "flow_1",
+    "job_run_params": {"param1": "value1"},
+}
+_LIST_ROW_2 = {
+    "id": "b2c3d4e5f67890a1b2c3d4e5f67890a1",
+    "input_dataset_ids": ["3c2b6d38-bd06-567d-c3ff-fddff4bc4e2f"],
+    "name": "Dataset 2",
+    "job_slug": "flow_2",
+    "job_run_params": {"param2": "value2"},
+}
+_LIST_ROW_SINGLE = {
+    "id": "c3d4e5f67890a1b2c3d4e5f67890a1b2",
+    "input_dataset_ids": ["2b1a5c27-ac95-456c-b2ff-eccfb3ab3d1e"],
+    "name": "Single Dataset",
+    "job_slug": "single_flow",
+    "sample_names": ["sample1", "sample2"],
+    "job_run_start_time": "2024-01-01T10:00:00Z",
+}
+
+_EXPECTED_CREATE_PAYLOAD = {
+    "dataset": {
+        "input_dataset_ids": ["2b1a5c27-ac95-456c-b2ff-eccfb3ab3d1e"],
+        "name": "Test dataset",
+        "job_slug": "demo_flow",
+        "sample_names": None,
+        "job_run_params": {"a_string_field": "demo123", "a_or_b_enum": "A"},
+    }
+}
+
+_HEADERS_DATASET = Dataset(
+    input_dataset_ids=[_UUID_A],
+    name="Test dataset",
+    job_slug="demo_flow",
+    job_run_params={},
+)
+
+
+def _response(status_code, json=None, text=""):
+    """Plain stand-in for requests.Response carrying only what Datasets reads"""
+    return SimpleNamespace(status_code=status_code, json=lambda: json, text=text)
+
 
 class TestDatasets:
     """Test cases for Datasets resource"""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create a mock MDClient for testing"""
-        client = Mock(spec=MDClient)
-        return client
-
     @pytest.fixture
     def datasets_resource(self, mock_client):
         """Create Datasets resource instance with mock client"""
@@ -30,7 +72,7 @@ class TestDatasets:
     def sample_dataset(self):
         """Create a sample dataset for testing"""
         return Dataset(
-            input_dataset_ids=[UUID("2b1a5c27-ac95-456c-b2ff-eccfb3ab3d1e")],
+            input_dataset_ids=[_UUID_A],
             name="Test dataset",
             job_slug="demo_flow",
             job_run_params={"a_string_field": "demo123", "a_or_b_enum": "A"},
@@ -51,9 +93,7 @@ class TestDatasets:
     ):
         """Test successful dataset creation"""
         # Mock the API response
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = sample_api_response
+        mock_response = _response(201, json=sample_api_response)
 
         mock_client._make_request.return_value = mock_response
 
@@ -65,29 +105,22 @@ class TestDatasets:
 
         # Verify the API call was made correctly
         mock_client._make_request.assert_called_once()
-        call_args = mock_client._make_request.call_args
+        kwargs = mock_client._make_request.call_args.kwargs
 
-        assert call_args[1]["method"] == "POST"
-        assert call_args[1]["endpoint"] == "/datasets"
-        assert call_args[1]["headers"] == {
+        assert kwargs["method"] == "POST"
+        assert kwargs["endpoint"] == "/datasets"
+        assert kwargs["headers"] == {
             "Content-Type": "application/json",
             "accept": "application/vnd.md-v1+json",
         }
 
         # Verify the payload structure
-        payload = call_args[1]["json"]
-        assert "dataset" in payload
-        assert payload["dataset"]["name"] == sample_dataset.name
-        assert payload["dataset"]["job_slug"] == sample_dataset.job_slug
-        assert payload["dataset"]["input_dataset_ids"] == [
-            str(sample_dataset.input_dataset_ids[0])
-        ]
-        assert payload["dataset"]["job_run_params"] == sample_dataset.job_run_params
+        assert kwargs["json"] == _EXPECTED_CREATE_PAYLOAD
 
     def test_create_with_sample_names(self, datasets_resource, mock_client):
         """Test dataset creation includes sample_names in payload when set"""
         dataset_with_samples = Dataset(
-            input_dataset_ids=[UUID("2b1a5c27-ac95-456c-b2ff-eccfb3ab3d1e")],
+            input_dataset_ids=[_UUID_A],
             name="Test doseresponse dataset",
             job_slug="dose_response",
             job_run_params={
@@ -96,14 +129,12 @@ class TestDatasets:
             },
             sample_names=["1", "2", "3", "4", "5", "6"],
         )
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {"dataset_id": "drc-id-123"}
+        mock_response = _response(201, json={"dataset_id": "drc-id-123"})
         mock_client._make_request.return_value = mock_response
 
         datasets_resource.create(dataset_with_samples)
 
-        payload = mock_client._make_request.call_args[1]["json"]
+        payload = mock_client._make_request.call_args.kwargs["json"]
         assert payload["dataset"]["sample_names"] == ["1", "2", "3", "4", "5", "6"]
 
     def test_create_success_200_status(
@@ -111,9 +142,7 @@ class TestDatasets:
     ):
         """Test successful dataset creation with 200 status code"""
         # Mock the API response with 200 status
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = sample_api_response
+        mock_response = _response(200, json=sample_api_response)
 
         mock_client._make_request.return_value = mock_response
 
@@ -126,9 +155,7 @@ class TestDatasets:
     def test_create_failure(self, datasets_resource, sample_dataset, mock_client):
         """Test dataset creation failure"""
         # Mock the API response with error
-        mock_response = Mock()
-        mock_response.status_code = 400
-        mock_response.text = "Bad Request: Invalid dataset data"
+        mock_response = _response(400, text="Bad Request: Invalid dataset data")
 
         mock_client._make_request.return_value = mock_response
 
@@ -145,18 +172,16 @@ class TestDatasets:
         """Test dataset creation with minimal required fields"""
         # Create minimal dataset
         minimal_dataset = Dataset(
-            input_dataset_ids=[UUID("2b1a5c27-ac95-456c-b2ff-eccfb3ab3d1e")],
+            input_dataset_ids=[_UUID_A],
             name="Minimal Dataset",
             job_slug="minimal_flow",
             job_run_params={},
         )
 
         # Mock the API response
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "dataset_id": "abcdef1234567890abcdef1234567890"
-        }
+        mock_response = _response(
+            201, json={"dataset_id": "abcdef1234567890abcdef1234567890"}
+        )
 
         mock_client._make_request.return_value = mock_response
 
@@ -167,8 +192,7 @@ class TestDatasets:
         assert result == "abcdef1234567890abcdef1234567890"
 
         # Verify the payload contains only the required fields
-        call_args = mock_client._make_request.call_args
-        payload = call_args[1]["json"]["dataset"]
+        payload = mock_client._make_request.call_args.kwargs["json"]["dataset"]
 
         assert payload["name"] == "Minimal Dataset"
         assert payload["job_slug"] == "minimal_flow"
@@ -180,8 +204,8 @@ class TestDatasets:
         # Create dataset with multiple input datasets
         multi_input_dataset = Dataset(
             input_dataset_ids=[
-                UUID("2b1a5c27-ac95-456c-b2ff-eccfb3ab3d1e"),
-                UUID("3c2b6d38-bd06-567d-c3ff-fddff4bc4e2f"),
+                _UUID_A,
+                _UUID_B,
             ],
             name="Multi Input Dataset",
             job_slug="multi_flow",
@@ -189,11 +213,9 @@ class TestDatasets:
         )
 
         # Mock the API response
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "dataset_id": "multi1234567890abcdef1234567890"
-        }
+        mock_response = _response(
+            201, json={"dataset_id": "multi1234567890abcdef1234567890"}
+        )
 
         mock_client._make_request.return_value = mock_response
 
@@ -204,8 +226,7 @@ class TestDatasets:
         assert result == "multi1234567890abcdef1234567890"
 
         # Verify the payload contains multiple input dataset IDs
-        call_args = mock_client._make_request.call_args
-        payload = call_args[1]["json"]["dataset"]
+        payload = mock_client._make_request.call_args.kwargs["json"]["dataset"]
 
         assert len(payload["input_dataset_ids"]) == 2
         assert "2b1a5c27-ac95-456c-b2ff-eccfb3ab3d1e" in payload["input_dataset_ids"]
@@ -215,7 +236,7 @@ class TestDatasets:
         """Test dataset creation with complex job run parameters"""
         # Create dataset with complex job parameters
         complex_params_dataset = Dataset(
-            input_dataset_ids=[UUID("2b1a5c27-ac95-456c-b2ff-eccfb3ab3d1e")],
+            input_dataset_ids=[_UUID_A],
             name="Complex Params Dataset",
             job_slug="complex_flow",
             job_run_params={
@@ -228,11 +249,9 @@ class TestDatasets:
         )
 
         # Mock the API response
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "dataset_id": "complex1234567890abcdef1234567890"
-        }
+        mock_response = _response(
+            201, json={"dataset_id": "complex1234567890abcdef1234567890"}
+        )
 
         mock_client._make_request.return_value = mock_response
 
@@ -243,8 +262,7 @@ class TestDatasets:
         assert result == "complex1234567890abcdef1234567890"
 
         # Verify the payload contains complex job parameters
-        call_args = mock_client._make_request.call_args
-        payload = call_args[1]["json"]["dataset"]
+        payload = mock_client._make_request.call_args.kwargs["json"]["dataset"]
 
         assert payload["job_run_params"]["string_param"] == "test_value"
         assert payload["job_run_params"]["number_param"] == 42
@@ -257,39 +275,35 @@ class TestDatasets:
     ):
         """Payload includes sample_names when dataset has sample_names set."""
         dataset = Dataset(
-            input_dataset_ids=[UUID("2b1a5c27-ac95-456c-b2ff-eccfb3ab3d1e")],
+            input_dataset_ids=[_UUID_A],
             name="With samples",
             job_slug="demo_flow",
             job_run_params={},
             sample_names=["s1", "s2"],
         )
 
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {"dataset_id": "abc123"}
+        mock_response = _response(201, json={"dataset_id": "abc123"})
         mock_client._make_request.return_value = mock_response
 
         datasets_resource.create(dataset)
 
-        payload = mock_client._make_request.call_args[1]["json"]["dataset"]
+        payload = mock_client._make_request.call_args.kwargs["json"]["dataset"]
         assert payload["sample_names"] == ["s1", "s2"]
 
     def test_create_with_empty_job_params(self, datasets_resource, mock_client):
         """Test dataset creation with empty job run parameters"""
         # Create dataset with empty job parameters
         empty_params_dataset = Dataset(
-            input_dataset_ids=[UUID("2b1a5c27-ac95-456c-b2ff-eccfb3ab3d1e")],
+            input_dataset_ids=[_UUID_A],
             name="Empty Params Dataset",
             job_slug="empty_flow",
             job_run_params={},
         )
 
         # Mock the API response
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "dataset_id": "empty1234567890abcdef1234567890"
-        }
+        mock_response = _response(
+            201, json={"dataset_id": "empty1234567890abcdef1234567890"}
+        )
 
         mock_client._make_request.return_value = mock_response
 
@@ -300,8 +314,7 @@ class TestDatasets:
         assert result == "empty1234567890abcdef1234567890"
 
         # Verify the payload contains empty job parameters
-        call_args = mock_client._make_request.call_args
-        payload = call_args[1]["json"]["dataset"]
+        payload = mock_client._make_request.call_args.kwargs["json"]["dataset"]
 
         assert payload["job_run_params"] == {}
 
@@ -309,18 +322,16 @@ class TestDatasets:
         """Test dataset creation with empty job run parameters"""
         # Create dataset with empty job parameters
         empty_params_dataset = Dataset(
-            input_dataset_ids=[UUID("2b1a5c27-ac95-456c-b2ff-eccfb3ab3d1e")],
+            input_dataset_ids=[_UUID_A],
             name="Empty Params Dataset",
             job_slug="empty_flow",
             job_run_params={},
         )
 
         # Mock the API response
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "dataset_id": "none1234567890abcdef1234567890"
-        }
+        mock_response = _response(
+            201, json={"dataset_id": "none1234567890abcdef1234567890"}
+        )
 
         mock_client._make_request.return_value = mock_response
 
@@ -331,42 +342,60 @@ class TestDatasets:
         assert result == "none1234567890abcdef1234567890"
 
         # Verify the payload contains empty job parameters (defaults to empty dict)
-        call_args = mock_client._make_request.call_args
-        payload = call_args[1]["json"]["dataset"]
+        payload = mock_client._make_request.call_args.kwargs["json"]["dataset"]
 
         assert payload["job_run_params"] == {}
 
-    def test_create_headers_verification(
-        self, datasets_resource, sample_dataset, mock_client
+    @pytest.mark.parametrize(
+        "operation,arg,response,expected_headers",
+        [
+            (
+                "create",
+                _HEADERS_DATASET,
+                _response(201, json={"dataset_id": "header1234567890abcdef1234567890"}),
+                {
+                    "Content-Type": "application/json",
+                    "accept": "application/vnd.md-v1+json",
+                },
+            ),
+            (
+                "list_by_experiment",
+                "5f457885-2eff-4406-ae7f-c178e7ed1d55",
+                _response(200, json=[]),
+                {"accept": "application/vnd.md-v1+json"},
+            ),
+            (
+                "delete",
+                "test-dataset-id",
+                SimpleNamespace(status_code=204),
+                {"accept": "application/vnd.md-v1+json"},
+            ),
+            (
+                "retry",
+                "test-dataset-id",
+                SimpleNamespace(status_code=200),
+                {"accept": "application/vnd.md-v1+json"},
+            ),
+        ],
+        ids=["create", "list_by_experiment", "delete", "retry"],
+    )
+    def test_headers(
+        self, datasets_resource, mock_client, operation, arg, response, expected_headers
     ):
-        """Test that correct headers are sent in the request"""
-        # Mock the API response
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "dataset_id": "header1234567890abcdef1234567890"
-        }
+        """Test that correct headers are sent for each request"""
+        mock_client._make_request.return_value = response
 
-        mock_client._make_request.return_value = mock_response
+        getattr(datasets_resource, operation)(arg)
 
-        # Call the create method
-        datasets_resource.create(sample_dataset)
-
-        # Verify the headers are correct
-        call_args = mock_client._make_request.call_args
-        headers = call_args[1]["headers"]
-
-        assert headers["Content-Type"] == "application/json"
-        assert headers["accept"] == "application/vnd.md-v1+json"
-        assert len(headers) == 2
+        assert mock_client._make_request.call_args.kwargs["headers"] == expected_headers
 
     def test_create_uuid_conversion(self, datasets_resource, mock_client):
         """Test that UUID objects are properly converted to strings in the payload"""
         # Create dataset with UUID input dataset IDs
         uuid_dataset = Dataset(
             input_dataset_ids=[
-                UUID("2b1a5c27-ac95-456c-b2ff-eccfb3ab3d1e"),
-                UUID("4d3c7e49-ce17-678e-d4ff-feeff5cd5f3f"),
+                _UUID_A,
+                _UUID_C,
             ],
             name="UUID Test Dataset",
             job_slug="uuid_flow",
@@ -374,11 +403,9 @@ class TestDatasets:
         )
 
         # Mock the API response
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "dataset_id": "uuid1234567890abcdef1234567890"
-        }
+        mock_response = _response(
+            201, json={"dataset_id": "uuid1234567890abcdef1234567890"}
+        )
 
         mock_client._make_request.return_value = mock_response
 
@@ -389,8 +416,7 @@ class TestDatasets:
         assert result == "uuid1234567890abcdef1234567890"
 
         # Verify UUIDs are converted to strings in the payload
-        call_args = mock_client._make_request.call_args
-        payload = call_args[1]["json"]["dataset"]
+        payload = mock_client._make_request.call_args.kwargs["json"]["dataset"]
 
         assert payload["input_dataset_ids"] == [
             "2b1a5c27-ac95-456c-b2ff-eccfb3ab3d1e",
@@ -399,72 +425,20 @@ class TestDatasets:
         # Verify they are strings, not UUID objects
         assert all(isinstance(did, str) for did in payload["input_dataset_ids"])
 
-    def test_list_by_experiment_success(self, datasets_resource, mock_client):
-        """Test successful retrieval of datasets by experiment"""
-        # Mock the API response with multiple datasets
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [
-            {
-                "id": "a1b2c3d4e5f67890a1b2c3d4e5f67890",
-                "input_dataset_ids": ["2b1a5c27-ac95-456c-b2ff-eccfb3ab3d1e"],
-                "name": "Dataset 1",
-                "job_slug": "flow_1",
-                "job_run_params": {"param1": "value1"},
-            },
-            {
-                "id": "b2c3d4e5f67890a1b2c3d4e5f67890a1",
-                "input_dataset_ids": ["3c2b6d38-bd06-567d-c3ff-fddff4bc4e2f"],
-                "name": "Dataset 2",
-                "job_slug": "flow_2",
-                "job_run_params": {"param2": "value2"},
-            },
-        ]
-
-        mock_client._make_request.return_value = mock_response
-
-        # Call the list_by_experiment method
-        experiment_id = "5f457885-2eff-4406-ae7f-c178e7ed1d55"
-        result = datasets_resource.list_by_experiment(experiment_id)
-
-        # Verify the result
-        assert len(result) == 2
-        assert isinstance(result[0], Dataset)
-        assert isinstance(result[1], Dataset)
-
-        # Verify first dataset
-        assert result[0].id == UUID("a1b2c3d4e5f67890a1b2c3d4e5f67890")
-        assert result[0].name == "Dataset 1"
-        assert result[0].job_slug == "flow_1"
-        assert result[0].job_run_params == {"param1": "value1"}
-        assert len(result[0].input_dataset_ids) == 1
-        assert result[0].input_dataset_ids[0] == UUID(
-            "2b1a5c27-ac95-456c-b2ff-eccfb3ab3d1e"
-        )
-
-        # Verify second dataset
-        assert result[1].id == UUID("b2c3d4e5f67890a1b2c3d4e5f67890a1")
-        assert result[1].name == "Dataset 2"
-        assert result[1].job_slug == "flow_2"
-        assert result[1].job_run_params == {"param2": "value2"}
-        assert len(result[1].input_dataset_ids) == 1
-        assert result[1].input_dataset_ids[0] == UUID(
-            "3c2b6d38-bd06-567d-c3ff-fddff4bc4e2f"
-        )
-
-        # Verify the API call was made correctly
-        mock_client._make_request.assert_called_once_with(
-            method="GET",
-            endpoint=f"/datasets?experiment_id={experiment_id}",
-            headers={"accept": "application/vnd.md-v1+json"},
-        )
-
-    def test_list_by_experiment_empty_result(self, datasets_resource, mock_client):
-        """Test list_by_experiment when no datasets are found"""
-        # Mock the API response with empty list
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = []
+    @pytest.mark.parametrize(
+        "payload,expected_len",
+        [
+            ([], 0),
+            ([_LIST_ROW_SINGLE], 1),
+            ([_LIST_ROW_1, _LIST_ROW_2], 2),
+        ],
+        ids=["empty", "single", "multiple"],
+    )
+    def test_list_by_experiment_success(
+        self, datasets_resource, mock_client, payload, expected_len
+    ):
+        """Test successful retrieval of zero, one and many datasets by experiment"""
+        mock_response = _response(200, json=payload)
 
         mock_client._make_request.return_value = mock_response
 
@@ -473,8 +447,24 @@ class TestDatasets:
         result = datasets_resource.list_by_experiment(experiment_id)
 
         # Verify the result
-        assert len(result) == 0
         assert isinstance(result, list)
+        assert len(result) == expected_len
+
+        # Verify each dataset mirrors its API row
+        if expected_len:
+            for dataset, row in zip(result, payload):
+                assert isinstance(dataset, Dataset)
+                assert dataset.id == UUID(row["id"])
+                assert dataset.name == row["name"]
+                assert dataset.job_slug == row["job_slug"]
+                assert dataset.job_run_params == row.get("job_run_params", {})
+                assert dataset.input_dataset_ids == [
+                    UUID(did) for did in row["input_dataset_ids"]
+                ]
+                assert dataset.sample_names == row.get("sample_names")
+                assert (dataset.job_run_start_time is not None) == (
+                    "job_run_start_time" in row
+                )
 
         # Verify the API call was made correctly
         mock_client._make_request.assert_called_once_with(
@@ -483,46 +473,10 @@ class TestDatasets:
             headers={"accept": "application/vnd.md-v1+json"},
         )
 
-    def test_list_by_experiment_single_dataset(self, datasets_resource, mock_client):
-        """Test list_by_experiment with single dataset result"""
-        # Mock the API response with single dataset
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [
-            {
-                "id": "c3d4e5f67890a1b2c3d4e5f67890a1b2",
-                "input_dataset_ids": ["2b1a5c27-ac95-456c-b2ff-eccfb3ab3d1e"],
-                "name": "Single Dataset",
-                "job_slug": "single_flow",
-                "sample_names": ["sample1", "sample2"],
-                "job_run_start_time": "2024-01-01T10:00:00Z",
-            }
-        ]
-
-        mock_client._make_request.return_value = mock_response
-
-        # Call the list_by_experiment method
-        experiment_id = "5f457885-2eff-4406-ae7f-c178e7ed1d55"
-        result = datasets_resource.list_by_experiment(experiment_id)
-
-        # Verify the result
-        assert len(result) == 1
-        assert isinstance(result[0], Dataset)
-
-        # Verify dataset details
-        assert result[0].id == UUID("c3d4e5f67890a1b2c3d4e5f67890a1b2")
-        assert result[0].name == "Single Dataset"
-        assert result[0].job_slug == "single_flow"
-        assert result[0].sample_names == ["sample1", "sample2"]
-        assert result[0].job_run_start_time is not None
-        assert result[0].job_run_params == {}
-
     def test_list_by_experiment_failure(self, datasets_resource, mock_client):
         """Test list_by_experiment failure handling"""
         # Mock the API response with error
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.text = "Experiment not found"
+        mock_response = _response(404, text="Experiment not found")
 
         mock_client._make_request.return_value = mock_response
 
@@ -541,15 +495,16 @@ class TestDatasets:
     ):
         """Test list_by_experiment with minimal dataset data"""
         # Mock the API response with minimal dataset
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [
-            {
-                "name": "Minimal Dataset",
-                "job_slug": "minimal_flow",
-                "job_run_params": {},
-            }
-        ]
+        mock_response = _response(
+            200,
+            json=[
+                {
+                    "name": "Minimal Dataset",
+                    "job_slug": "minimal_flow",
+                    "job_run_params": {},
+                }
+            ],
+        )
 
         mock_client._make_request.return_value = mock_response
 
@@ -570,34 +525,10 @@ class TestDatasets:
         assert result[0].job_run_params == {}
         assert result[0].job_run_start_time is None
 
-    def test_list_by_experiment_headers_verification(
-        self, datasets_resource, mock_client
-    ):
-        """Test that correct headers are sent in the request"""
-        # Mock the API response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = []
-
-        mock_client._make_request.return_value = mock_response
-
-        # Call the list_by_experiment method
-        experiment_id = "5f457885-2eff-4406-ae7f-c178e7ed1d55"
-        datasets_resource.list_by_experiment(experiment_id)
-
-        # Verify the headers are correct
-        call_args = mock_client._make_request.call_args
-        headers = call_args[1]["headers"]
-
-        assert headers["accept"] == "application/vnd.md-v1+json"
-        assert len(headers) == 1
-
     def test_list_by_experiment_url_encoding(self, datasets_resource, mock_client):
         """Test that experiment_id is properly included in the URL"""
         # Mock the API response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = []
+        mock_response = _response(200, json=[])
 
         mock_client._make_request.return_value = mock_response
 
@@ -606,18 +537,72 @@ class TestDatasets:
         datasets_resource.list_by_experiment(experiment_id)
 
         # Verify the endpoint is correct
-        call_args = mock_client._make_request.call_args
-        endpoint = call_args[1]["endpoint"]
+        endpoint = mock_client._make_request.call_args.kwargs["endpoint"]
 
         assert endpoint == f"/datasets?experiment_id={experiment_id}"
-        assert "experiment_id=" in endpoint
-        assert experiment_id in endpoint
+
+    def test_list_by_experiment_with_filters(self, datasets_resource, mock_client):
+        """Test that type and state filters are sent as query parameters"""
+        mock_client._make_request.return_value = _response(200, json=[])
+
+        experiment_id = "5f457885-2eff-4406-ae7f-c178e7ed1d55"
+        datasets_resource.list_by_experiment(
+            experiment_id, type="INTENSITY", state="COMPLETED"
+        )
+
+        kwargs = mock_client._make_request.call_args.kwargs
+        assert kwargs["endpoint"] == f"/datasets?experiment_id={experiment_id}"
+        assert kwargs["params"] == {"type": "INTENSITY", "state": "COMPLETED"}
+
+    def test_iter_states_by_experiment(self, datasets_resource, mock_client):
+        """Test that only id and state are extracted from each dataset row"""
+        mock_client._make_request.return_value = _response(
+            200, json=[dict(_LIST_ROW_1, state="COMPLETED"), _LIST_ROW_2]
+        )
+
+        result = list(
+            datasets_resource.iter_states_by_experiment(
+                "5f457885-2eff-4406-ae7f-c178e7ed1d55"
+            )
+        )
+
+        assert result == [
+            DatasetState(id=UUID(_LIST_ROW_1["id"]), state="COMPLETED"),
+            DatasetState(id=UUID(_LIST_ROW_2["id"]), state=None),
+        ]
+        assert "stream" not in mock_client._make_request.call_args.kwargs
+
+    def test_iter_states_by_experiment_is_lazy(self, datasets_resource, mock_client):
+        """Test that rows after the last one read are never parsed"""
+        mock_client._make_request.return_value = _response(
+            200, json=[_LIST_ROW_1, {"id": "not-a-uuid"}]
+        )
+
+        states = datasets_resource.iter_states_by_experiment(
+            "5f457885-2eff-4406-ae7f-c178e7ed1d55"
+        )
+
+        assert next(states).id == UUID(_LIST_ROW_1["id"])
+        states.close()
+
+    def test_iter_states_by_experiment_failure(self, datasets_resource, mock_client):
+        """Test iter_states_by_experiment failure handling"""
+        mock_client._make_request.return_value = _response(
+            404, text="Experiment not found"
+        )
+
+        with pytest.raises(Exception) as exc_info:
+            list(datasets_resource.iter_states_by_experiment("missing"))
+
+        assert (
+            "Failed to get datasets by experiment: 404 - Experiment not found"
+            in str(exc_info.value)
+        )
 
     def test_delete_success(self, datasets_resource, mock_client):
         """Test successful dataset deletion"""
         # Mock the API response with 204 status (successful deletion)
-        mock_response = Mock()
-        mock_response.status_code = 204
+        mock_response = SimpleNamespace(status_code=204)
 
         mock_client._make_request.return_value = mock_response
 
@@ -638,9 +623,7 @@ class TestDatasets:
     def test_delete_failure(self, datasets_resource, mock_client):
         """Test dataset deletion failure"""
         # Mock the API response with error
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.text = "Dataset not found"
+        mock_response = _response(404, text="Dataset not found")
 
         mock_client._make_request.return_value = mock_response
 
@@ -660,9 +643,7 @@ class TestDatasets:
 
         for status_code in error_codes:
             # Mock the API response with error
-            mock_response = Mock()
-            mock_response.status_code = status_code
-            mock_response.text = f"Error {status_code}"
+            mock_response = _response(status_code, text=f"Error {status_code}")
 
             mock_client._make_request.return_value = mock_response
 
@@ -675,30 +656,10 @@ class TestDatasets:
                 in str(exc_info.value)
             )
 
-    def test_delete_headers_verification(self, datasets_resource, mock_client):
-        """Test that correct headers are sent in the delete request"""
-        # Mock the API response
-        mock_response = Mock()
-        mock_response.status_code = 204
-
-        mock_client._make_request.return_value = mock_response
-
-        # Call the delete method
-        dataset_id = "test-dataset-id"
-        datasets_resource.delete(dataset_id)
-
-        # Verify the headers are correct
-        call_args = mock_client._make_request.call_args
-        headers = call_args[1]["headers"]
-
-        assert headers["accept"] == "application/vnd.md-v1+json"
-        assert len(headers) == 1
-
     def test_delete_endpoint_construction(self, datasets_resource, mock_client):
         """Test that the delete endpoint is constructed correctly"""
         # Mock the API response
-        mock_response = Mock()
-        mock_response.status_code = 204
+        mock_response = SimpleNamespace(status_code=204)
 
         mock_client._make_request.return_value = mock_response
 
@@ -719,28 +680,14 @@ class TestDatasets:
             datasets_resource.delete(dataset_id)
 
             # Verify the endpoint is correct
-            call_args = mock_client._make_request.call_args
-            endpoint = call_args[1]["endpoint"]
+            endpoint = mock_client._make_request.call_args.kwargs["endpoint"]
 
             assert endpoint == f"/datasets/{dataset_id}"
-            assert endpoint.startswith("/datasets/")
-            assert endpoint.endswith(dataset_id)
-
-    def test_delete_method_type(self, datasets_resource):
-        """Test that delete method returns boolean on success"""
-        # This test verifies the method signature and return type
-        assert callable(datasets_resource.delete)
-
-        # Verify the method exists and is callable
-        method = getattr(datasets_resource, "delete", None)
-        assert method is not None
-        assert callable(method)
 
     def test_retry_success(self, datasets_resource, mock_client):
         """Test successful dataset retry"""
         # Mock the API response with 200 status (successful retry)
-        mock_response = Mock()
-        mock_response.status_code = 200
+        mock_response = SimpleNamespace(status_code=200)
 
         mock_client._make_request.return_value = mock_response
 
@@ -761,9 +708,7 @@ class TestDatasets:
     def test_retry_failure(self, datasets_resource, mock_client):
         """Test dataset retry failure"""
         # Mock the API response with error
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.text = "Dataset not found"
+        mock_response = _response(404, text="Dataset not found")
 
         mock_client._make_request.return_value = mock_response
 
@@ -781,9 +726,7 @@ class TestDatasets:
 
         for status_code in error_codes:
             # Mock the API response with error
-            mock_response = Mock()
-            mock_response.status_code = status_code
-            mock_response.text = f"Error {status_code}"
+            mock_response = _response(status_code, text=f"Error {status_code}")
 
             mock_client._make_request.return_value = mock_response
 
@@ -796,64 +739,23 @@ class TestDatasets:
                 in str(exc_info.value)
             )
 
-    def test_retry_headers_verification(self, datasets_resource, mock_client):
-        """Test that correct headers are sent in the retry request"""
-        # Mock the API response
-        mock_response = Mock()
-        mock_response.status_code = 200
-
-        mock_client._make_request.return_value = mock_response
-
-        # Call the retry method
-        dataset_id = "test-dataset-id"
-        datasets_resource.retry(dataset_id)
-
-        # Verify the headers are correct
-        call_args = mock_client._make_request.call_args
-        headers = call_args[1]["headers"]
-
-        assert headers["accept"] == "application/vnd.md-v1+json"
-        assert len(headers) == 1
-
-    def test_retry_endpoint_construction(self, datasets_resource, mock_client):
-        """Test that the retry endpoint is constructed correctly"""
-        # Mock the API response
-        mock_response = Mock()
-        mock_response.status_code = 200
-
-        mock_client._make_request.return_value = mock_response
-
-        # Test with different dataset IDs
-        test_dataset_ids = [
+    @pytest.mark.parametrize(
+        "dataset_id",
+        [
             "e8d77807-b06c-4daf-a655-b860b520ac79",
             "ff07b3c2-249a-429c-ade3-8e9b4eba054f",
             "simple-id",
             "id-with-special-chars_123",
-        ]
-
-        for dataset_id in test_dataset_ids:
-            # Reset mock for each iteration
-            mock_client._make_request.reset_mock()
-            mock_client._make_request.return_value = mock_response
+        ],
+        ids=["uuid-a", "uuid-b", "simple", "special-chars"],
+    )
+    def test_retry_endpoint_construction(
+        self, datasets_resource, mock_client, dataset_id
+    ):
+        """Test that the retry endpoint is constructed correctly"""
+        mock_client._make_request.return_value = SimpleNamespace(status_code=200)
 
-            # Call the retry method
-            datasets_resource.retry(dataset_id)
+        datasets_resource.retry(dataset_id)
 
-            # Verify the endpoint is correct
-            call_args = mock_client._make_request.call_args
-            endpoint = call_args[1]["endpoint"]
-
-            assert endpoint == f"/datasets/{dataset_id}/retry"
-            assert endpoint.startswith("/datasets/")
-            assert endpoint.endswith("/retry")
-            assert dataset_id in endpoint
-
-    def test_retry_method_type(self, datasets_resource):
-        """Test that retry method returns boolean on success"""
-        # This test verifies the method signature and return type
-        assert callable(datasets_resource.retry)
-
-        # Verify the method exists and is callable
-        method = getattr(datasets_resource, "retry", None)
-        assert method is not None
-        assert callable(method)
+        expected = f"/datasets/{dataset_id}/retry"
+        assert mock_client._make_request.call_args.kwargs["endpoint"] == expected
@@ -1,9 +1,9 @@
 from uuid import UUID
 
 import pytest
+import requests
 
-from md_python.client import MDClientV1 as MDClient
-from md_python.models import Dataset
+from md_python.models import Dataset, DatasetState
 from md_python.resources.datasets import Datasets
 
 
@@ -18,11 +18,11 @@ def ds(state: str, id_str: str = "11111111-1111-1111-1111-111111111111") -> Data
     )
 
 
-class TestDatasetsWait:
-    @pytest.fixture
-    def mock_client(self, mocker):
-        return mocker.Mock(spec=MDClient)
+def state(state: str, id_str: str) -> DatasetState:
+    return DatasetState(id=UUID(id_str), state=state)
+
 
+class TestDatasetsWait:
     @pytest.fixture
     def res(self, mock_client):
         return Datasets(mock_client)
@@ -33,7 +33,7 @@ class TestDatasetsWait:
         out = res.wait_until_complete(
             "exp-1", "11111111-1111-1111-1111-111111111111", poll_s=0, timeout_s=1
         )
-        assert isinstance(out, dict) or isinstance(out, Dataset)
+        assert isinstance(out, (dict, Dataset))
 
     def test_wait_until_complete_failure(self, res, mocker):
         mocker.patch.object(res, "list_by_experiment", return_value=[ds("FAILED")])
@@ -42,12 +42,182 @@ class TestDatasetsWait:
                 "exp-1", "11111111-1111-1111-1111-111111111111", poll_s=0, timeout_s=1
             )
 
+    def test_wait_until_complete_timeout(self, res, mocker):
+        mocker.patch.object(res, "get_by_id", return_value=ds("PROCESSING"))
+        with pytest.raises(TimeoutError, match="last state=PROCESSING"):
+            res.wait_until_complete(
+                "exp-1", "11111111-1111-1111-1111-111111111111", poll_s=0, timeout_s=0
+            )
+
+    def test_wait_until_complete_backs_off_exponentially(self, res, mocker):
+        sleep = mocker.patch("md_python.resources.datasets.time.sleep")
+        mocker.patch.object(
+            res,
+            "get_by_id",
+            side_effect=[ds("PROCESSING")] * 4 + [ds("COMPLETED")],
+        )
+        res.wait_until_complete(
+            "exp-1",
+            "11111111-1111-1111-1111-111111111111",
+            poll_s=1,
+            timeout_s=3600,
+            max_poll_s=4,
+            jitter=0,
+        )
+        assert [c.args[0] for c in sleep.call_args_list] == [1, 2, 4, 4]
+
+    def test_wait_until_complete_caps_first_poll(self, res, mocker):
+        sleep = mocker.patch("md_python.resources.datasets.time.sleep")
+        mocker.patch.object(
+            res, "get_by_id", side_effect=[ds("PROCESSING"), ds("COMPLETED")]
+        )
+        res.wait_until_complete(
+            "exp-1",
+            "11111111-1111-1111-1111-111111111111",
+            poll_s=60,
+            timeout_s=3600,
+            max_poll_s=4,
+            jitter=0,
+        )
+        sleep.assert_called_once_with(4)
+
+    def test_wait_until_complete_jitters_backoff(self, res, mocker):
+        sleep = mocker.patch("md_python.resources.datasets.time.sleep")
+        mocker.patch("md_python.resources.datasets.random.random", return_value=1.0)
+        mocker.patch.object(
+            res, "get_by_id", side_effect=[ds("PROCESSING"), ds("COMPLETED")]
+        )
+        res.wait_until_complete(
+            "exp-1",
+            "11111111-1111-1111-1111-111111111111",
+            poll_s=2,
+            timeout_s=3600,
+            jitter=0.5,
+        )
+        sleep.assert_called_once_with(3.0)
+
+    @pytest.mark.parametrize("jitter", [-0.1, 1.5])
+    def test_wait_rejects_jitter_out_of_range(self, res, jitter):
+        with pytest.raises(ValueError, match="jitter"):
+            res.wait_until_complete("exp-1", "ds-1", jitter=jitter)
+        with pytest.raises(ValueError, match="jitter"):
+            res.wait_many("exp-1", ["ds-1"], jitter=jitter)
+
+    def test_wait_until_complete_raises_first_list_error(self, res, mocker):
+        sleep = mocker.patch("md_python.resources.datasets.time.sleep")
+        mocker.patch.object(res, "get_by_id", side_effect=Exception("unsupported"))
+        lister = mocker.patch.object(
+            res,
+            "list_by_experiment",
+            side_effect=requests.ConnectionError("connection refused"),
+        )
+        with pytest.raises(requests.ConnectionError):
+            res.wait_until_complete(
+                "exp-1", "11111111-1111-1111-1111-111111111111", timeout_s=3600
+            )
+        lister.assert_called_once()
+        sleep.assert_not_called()
+
+    def test_wait_until_complete_raises_get_by_id_network_error(self, res, mocker):
+        mocker.patch.object(
+            res, "get_by_id", side_effect=requests.Timeout("read timed out")
+        )
+        lister = mocker.patch.object(res, "list_by_experiment")
+        with pytest.raises(requests.Timeout):
+            res.wait_until_complete(
+                "exp-1", "11111111-1111-1111-1111-111111111111", timeout_s=3600
+            )
+        lister.assert_not_called()
+
+    def test_wait_many_success(self, res, mocker):
+        # unhyphenated IDs, as the API returns them, key the result unchanged
+        a = "11111111111111111111111111111111"
+        b = "22222222222222222222222222222222"
+        states = mocker.patch.object(
+            res,
+            "iter_states_by_experiment",
+            side_effect=[
+                [state("COMPLETED", a), state("PROCESSING", b)],
+                [state("COMPLETED", a), state("COMPLETED", b)],
+            ],
+        )
+        lister = mocker.patch.object(
+            res,
+            "list_by_experiment",
+            return_value=[ds("COMPLETED", a), ds("COMPLETED", b)],
+        )
+        out = res.wait_many("exp-1", [a, b], poll_s=0, timeout_s=1)
+        assert out == {a: ds("COMPLETED", a), b: ds("COMPLETED", b)}
+        assert states.call_count == 2
+        lister.assert_called_once()
+
+    def test_wait_many_no_datasets(self, res, mocker):
+        states = mocker.patch.object(res, "iter_states_by_experiment")
+        assert res.wait_many("exp-1", []) == {}
+        states.assert_not_called()
+
+    def test_wait_many_invalid_id(self, res):
+        with pytest.raises(ValueError, match="not-a-uuid"):
+            res.wait_many("exp-1", ["not-a-uuid"])
+
+    def test_wait_many_fetches_datasets_missing_from_list(self, res, mocker):
+        a = "11111111-1111-1111-1111-111111111111"
+        mocker.patch.object(
+            res, "iter_states_by_experiment", return_value=[state("COMPLETED", a)]
+        )
+        mocker.patch.object(res, "list_by_experiment", return_value=[])
+        getter = mocker.patch.object(
+            res, "get_by_id", side_effect=[ds("COMPLETED", a), None]
+        )
+
+        assert res.wait_many("exp-1", [a], poll_s=0, timeout_s=1) == {
+            a: ds("COMPLETED", a)
+        }
+        getter.assert_called_once_with(a)
+
+        with pytest.raises(Exception, match=f"{a} completed but was not found"):
+            res.wait_many("exp-1", [a], poll_s=0, timeout_s=1)
+
+    def test_wait_many_failure(self, res, mocker):
+        a = "11111111-1111-1111-1111-111111111111"
+        b = "22222222-2222-2222-2222-222222222222"
+        mocker.patch.object(
+            res,
+            "iter_states_by_experiment",
+            return_value=[state("COMPLETED", a), state("FAILED", b)],
+        )
+        with pytest.raises(Exception, match=b):
+            res.wait_many("exp-1", [a, b], poll_s=0, timeout_s=1)
+
+    def test_wait_many_timeout(self, res, mocker):
+        a = "11111111111111111111111111111111"
+        b = "22222222222222222222222222222222"
+        mocker.patch.object(
+            res,
+            "iter_states_by_experiment",
+            return_value=[state("COMPLETED", a), state("PROCESSING", b)],
+        )
+        with pytest.raises(TimeoutError, match=rf"\['{b}'\] not terminal"):
+            res.wait_many("exp-1", [a, b], poll_s=0, timeout_s=0)
+
+    def test_wait_many_raises_first_network_error(self, res, mocker):
+        sleep = mocker.patch("md_python.resources.datasets.time.sleep")
+        states = mocker.patch.object(
+            res,
+            "iter_states_by_experiment",
+            side_effect=requests.ConnectionError("connection refused"),
+        )
+        with pytest.raises(requests.ConnectionError):
+            res.wait_many(
+                "exp-1", ["11111111-1111-1111-1111-111111111111"], timeout_s=3600
+            )
+        states.assert_called_once()
+        sleep.assert_not_called()
+
     def test_find_initial_dataset(self, res, mock_client, mocker):
         # name preference via experiments.get_by_id
         mock_exp = mocker.Mock()
         mock_exp.name = "X"
-        # ensure nested attribute exists on spec mock
-        mock_client.experiments = mocker.Mock()
         mock_client.experiments.get_by_id.return_value = mock_exp
         d_int = ds("COMPLETED")
         d_int.type = "INTENSITY"
@@ -55,3 +225,75 @@ class TestDatasetsWait:
         mocker.patch.object(res, "list_by_experiment", return_value=[d_int])
         out = res.find_initial_dataset("exp-1")
         assert out is d_int
+
+    def test_find_initial_dataset_without_intensity(self, res, mock_client, mocker):
+        mock_exp = mocker.Mock()
+        mock_exp.name = "X"
+        mock_client.experiments.get_by_id.return_value = mock_exp
+        lister = mocker.patch.object(res, "list_by_experiment", return_value=[])
+        with pytest.raises(ValueError, match="No intensity dataset found"):
+            res.find_initial_dataset("exp-1")
+        lister.assert_called_once_with(experiment_id="exp-1", type="INTENSITY")
+
+    def test_find_initial_dataset_retries_after_rename(self, res, mock_client, mocker):
+        old_exp, new_exp = mocker.Mock(), mocker.Mock()
+        old_exp.name, new_exp.name = "old", "X"
+        mock_client.experiments.get_by_id.side_effect = [old_exp, new_exp]
+        d_int = ds("COMPLETED")
+        d_int.type = "INTENSITY"
+        d_int.name = "X"
+        mocker.patch.object(res, "list_by_experiment", return_value=[d_int])
+
+        with pytest.raises(ValueError, match="name has been changed"):
+            res.find_initial_dataset("exp-1")
+        assert res.find_initial_dataset("exp-1") is d_int
+        assert mock_client.experiments.get_by_id.call_count == 2
+
+    def test_find_initial_dataset_caches_result(self, res, mock_client, mocker):
+        mock_exp = mocker.Mock()
+        mock_exp.name = "X"
+        mock_client.experiments.get_by_id.return_value = mock_exp
+        d_int = ds("COMPLETED")
+        d_int.type = "INTENSITY"
+        d_int.name = "X"
+        lister = mocker.patch.object(res, "list_by_experiment", return_value=[d_int])
+
+        assert res.find_initial_dataset("exp-1") is d_int
+        cached = res.find_initial_dataset("exp-1")
+        assert cached == d_int and cached is not d_int
+        assert lister.call_count == 1
+
+        # callers get copies, so mutating one leaves the cache untouched
+        cached.state = "DELETED"
+        d_int.state = "DELETED"
+        assert res.find_initial_dataset("exp-1").state == "COMPLETED"
+
+        res.invalidate_experiment("exp-1")
+        res.find_initial_dataset("exp-1")
+        assert lister.call_count == 2
+
+        res.clear_cache()
+        res.find_initial_dataset("exp-1")
+        assert lister.call_count == 3
+
+    def test_find_initial_dataset_cache_is_bounded(self, res, mock_client, mocker):
+        mock_exp = mocker.Mock()
+        mock_exp.name = "X"
+        mock_client.experiments.get_by_id.return_value = mock_exp
+        d_int = ds("COMPLETED")
+        d_int.type = "INTENSITY"
+        d_int.name = "X"
+        mocker.patch.object(res, "list_by_experiment", return_value=[d_int])
+        mocker.patch("md_python.resources.datasets._CACHE_MAX_ENTRIES", 2)
+        clock = mocker.patch("md_python.resources.datasets.time.monotonic")
+
+        clock.return_value = 0.0
+        res.find_initial_dataset("exp-1")
+        res.find_initial_dataset("exp-2")
+        res.find_initial_dataset("exp-3")
+        assert list(res._initial_ds_cache) == ["exp-2", "exp-3"]
+
+        # entries past the TTL are dropped on the next store
+        clock.return_value = 301.0
+        res.find_initial_dataset("exp-4")
+        assert list(res._initial_ds_cache) == ["exp-4"]
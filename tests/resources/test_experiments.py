@@ -1,156 +1,259 @@
-from unittest.mock import Mock, mock_open, patch
+import io
+import re
+from types import MappingProxyType, SimpleNamespace
 
 import pytest
 
-from md_python.client import MDClientV1 as MDClient
 from md_python.models import Experiment, ExperimentDesign, SampleMetadata
-from md_python.resources.experiments import Experiments
 
+_EXPERIMENT_ID = "1234567890abcdef1234567890abcdef"
+_UPLOAD_EXPERIMENT_ID = "075296f0-9d6a-4bf0-8dbb-80074a255359"
+
+# update_sample_metadata only reads .data, so these are shared across tests
+_BASIC_METADATA = SampleMetadata(data=[["sample_name", "dose"], ["1", "1"]])
+_DOSE_METADATA = SampleMetadata(
+    data=[
+        ["sample_name", "dose"],
+        ["1", "1"],
+        ["2", "20"],
+        ["3", "30"],
+        ["4", "40"],
+        ["5", "50"],
+        ["6", "60"],
+    ]
+)
+_COMPLEX_METADATA = SampleMetadata(
+    data=[
+        ["sample_id", "patient_id", "age", "gender", "diagnosis", "treatment_group"],
+        ["S001", "P001", "45", "F", "healthy", "control"],
+        ["S002", "P002", "52", "M", "healthy", "control"],
+        ["S003", "P003", "38", "F", "disease", "treatment"],
+        ["S004", "P004", "61", "M", "disease", "treatment"],
+    ]
+)
+_SPECIAL_METADATA = SampleMetadata(
+    data=[
+        ["sample_name", "description", "notes"],
+        ["sample_1", "Control sample", "Normal condition"],
+        ["sample_2", "Treatment sample", "High dose (50mg/kg)"],
+        ["sample_3", "Special sample", "Contains: NaCl, H2O, pH=7.4"],
+    ]
+)
+
+
+_EXPECTED_CREATE_PAYLOAD = {
+    "experiment": {
+        "name": "Test Experiment",
+        "description": "A test experiment for unit testing",
+        "experiment_design": [
+            ["condition", "replicate"],
+            ["control", "1"],
+            ["treatment", "1"],
+        ],
+        "labelling_method": "manual",
+        "source": "test_source",
+        "filenames": ["file1.txt", "file2.txt"],
+        "sample_metadata": [
+            ["sample", "condition"],
+            ["sample1", "control"],
+            ["sample2", "treatment"],
+        ],
+        "s3_bucket": "test-bucket",
+        "s3_prefix": "experiments/test/",
+    }
+}
 
-class TestExperiments:
-    """Test cases for Experiments resource"""
-
-    @pytest.fixture
-    def mock_client(self):
-        """Create a mock MDClient for testing"""
-        client = Mock(spec=MDClient)
-        return client
-
-    @pytest.fixture
-    def experiments_resource(self, mock_client):
-        """Create Experiments resource instance with mock client"""
-        return Experiments(mock_client)
 
-    @pytest.fixture
-    def sample_experiment(self):
-        """Create a sample experiment for testing"""
-        experiment_design = ExperimentDesign(
-            data=[["condition", "replicate"], ["control", "1"], ["treatment", "1"]]
-        )
-        sample_metadata = SampleMetadata(
-            data=[
-                ["sample", "condition"],
-                ["sample1", "control"],
-                ["sample2", "treatment"],
-            ]
-        )
+_JSON_MD_HEADERS = {
+    "Content-Type": "application/json",
+    "accept": "application/vnd.md-v1+json",
+}
 
-        return Experiment(
-            name="Test Experiment",
-            description="A test experiment for unit testing",
-            experiment_design=experiment_design,
-            labelling_method="manual",
-            source="test_source",
-            s3_bucket="test-bucket",
-            s3_prefix="experiments/test/",
-            filenames=["file1.txt", "file2.txt"],
-            sample_metadata=sample_metadata,
-        )
 
-    @pytest.fixture
-    def sample_api_response(self):
-        """Sample API response for experiment creation"""
-        return {
-            "id": "1234567890abcdef1234567890abcdef",
+_SAMPLE_EXPERIMENT_RESPONSE = MappingProxyType(
+    {
+        "id": _EXPERIMENT_ID,
+        "name": "Test Experiment",
+        "description": "A test experiment for unit testing",
+        "experiment_design": [
+            ["condition", "replicate"],
+            ["control", "1"],
+            ["treatment", "1"],
+        ],
+        "labelling_method": "manual",
+        "source": "test_source",
+        "s3_bucket": "test-bucket",
+        "s3_prefix": "experiments/test/",
+        "filenames": ["file1.txt", "file2.txt"],
+        "sample_metadata": [
+            ["sample", "condition"],
+            ["sample1", "control"],
+            ["sample2", "treatment"],
+        ],
+        "created_at": "2024-01-01T00:00:00Z",
+        "status": "active",
+    }
+)
+_SAMPLE_EXPERIMENT_FIELDS = {
+    "name": "Test Experiment",
+    "description": "A test experiment for unit testing",
+    "source": "test_source",
+    "s3_bucket": "test-bucket",
+    "s3_prefix": "experiments/test/",
+    "filenames": ["file1.txt", "file2.txt"],
+    "labelling_method": "manual",
+    "status": "active",
+    "experiment_design": ExperimentDesign(
+        data=[["condition", "replicate"], ["control", "1"], ["treatment", "1"]]
+    ),
+    "sample_metadata": SampleMetadata(
+        data=[["sample", "condition"], ["sample1", "control"], ["sample2", "treatment"]]
+    ),
+}
+_MINIMAL_EXPERIMENT_RESPONSE = MappingProxyType(
+    {
+        "id": "fedcba0987654321fedcba0987654321",
+        "name": "Minimal Experiment",
+        "source": "minimal_source",
+    }
+)
+_MINIMAL_EXPERIMENT_FIELDS = {
+    "name": "Minimal Experiment",
+    "source": "minimal_source",
+    "description": None,
+    "experiment_design": None,
+    "sample_metadata": None,
+    "s3_bucket": "",
+    "s3_prefix": None,
+    "filenames": [],
+    "labelling_method": None,
+    "status": None,
+    "created_at": None,
+}
+_COMPLEX_DESIGN = ExperimentDesign(
+    data=[
+        ["sample_id", "condition", "timepoint", "replicate"],
+        ["S001", "control", "0h", "1"],
+        ["S002", "control", "0h", "2"],
+        ["S003", "treatment", "24h", "1"],
+        ["S004", "treatment", "24h", "2"],
+    ]
+)
+_COMPLEX_SAMPLE_METADATA = SampleMetadata(
+    data=[
+        ["sample_id", "patient_id", "age", "gender", "diagnosis"],
+        ["S001", "P001", "45", "F", "healthy"],
+        ["S002", "P002", "52", "M", "healthy"],
+        ["S003", "P003", "38", "F", "disease"],
+        ["S004", "P004", "61", "M", "disease"],
+    ]
+)
+
+
+def _response(status_code, json=None, text="", headers=None):
+    """Plain stand-in for requests.Response carrying only what Experiments reads"""
+    return SimpleNamespace(
+        status_code=status_code, json=lambda: json, text=text, headers=headers or {}
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_experiment():
+    """Create a sample experiment for testing"""
+    experiment_design = ExperimentDesign(
+        data=[["condition", "replicate"], ["control", "1"], ["treatment", "1"]]
+    )
+    sample_metadata = SampleMetadata(
+        data=[
+            ["sample", "condition"],
+            ["sample1", "control"],
+            ["sample2", "treatment"],
+        ]
+    )
+
+    return Experiment(
+        name="Test Experiment",
+        description="A test experiment for unit testing",
+        experiment_design=experiment_design,
+        labelling_method="manual",
+        source="test_source",
+        s3_bucket="test-bucket",
+        s3_prefix="experiments/test/",
+        filenames=["file1.txt", "file2.txt"],
+        sample_metadata=sample_metadata,
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_api_response():
+    """Sample API response for experiment creation, read-only as it is shared"""
+    return MappingProxyType(
+        {
+            "id": _EXPERIMENT_ID,
             "name": "Test Experiment",
             "description": "A test experiment for unit testing",
             "status": "created",
         }
+    )
+
+
+class TestExperimentsCreate:
+    """Test cases for Experiments.create"""
 
     @pytest.fixture
-    def sample_experiment_response(self):
-        """Sample API response for getting experiment by ID"""
-        return {
-            "id": "1234567890abcdef1234567890abcdef",
-            "name": "Test Experiment",
-            "description": "A test experiment for unit testing",
-            "experiment_design": [
-                ["condition", "replicate"],
-                ["control", "1"],
-                ["treatment", "1"],
-            ],
-            "labelling_method": "manual",
-            "source": "test_source",
-            "s3_bucket": "test-bucket",
-            "s3_prefix": "experiments/test/",
-            "filenames": ["file1.txt", "file2.txt"],
-            "sample_metadata": [
-                ["sample", "condition"],
-                ["sample1", "control"],
-                ["sample2", "treatment"],
-            ],
-            "created_at": "2024-01-01T00:00:00Z",
-            "status": "active",
-        }
+    def upload_patches(self, mocker):
+        """Stub the file system and S3 PUTs used by Uploads"""
+        return SimpleNamespace(
+            put=mocker.patch("md_python.uploads.requests.put"),
+            getsize=mocker.patch("md_python.uploads.os.path.getsize"),
+            exists=mocker.patch("md_python.uploads.os.path.exists", return_value=True),
+            open=mocker.patch(
+                "md_python.uploads.open",
+                lambda *args, **kwargs: io.BytesIO(b"file content"),
+                create=True,
+            ),
+        )
 
+    @pytest.mark.parametrize("status_code", [200, 201])
     def test_create_success(
-        self, experiments_resource, sample_experiment, sample_api_response, mock_client
+        self,
+        status_code,
+        experiments_resource,
+        sample_experiment,
+        sample_api_response,
+        mock_client,
     ):
         """Test successful experiment creation"""
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = sample_api_response
+        mock_response = _response(status_code, json=sample_api_response)
 
         mock_client._make_request.return_value = mock_response
 
         result = experiments_resource.create(sample_experiment)
 
-        assert result == "1234567890abcdef1234567890abcdef"
-
-        mock_client._make_request.assert_called_once()
-        call_args = mock_client._make_request.call_args
-
-        assert call_args[1]["method"] == "POST"
-        assert call_args[1]["endpoint"] == "/experiments"
-        assert call_args[1]["headers"] == {"Content-Type": "application/json"}
-
-        payload = call_args[1]["json"]
-        assert "experiment" in payload
-        assert payload["experiment"]["name"] == sample_experiment.name
-        assert payload["experiment"]["description"] == sample_experiment.description
-        assert payload["experiment"]["source"] == sample_experiment.source
-        assert payload["experiment"]["s3_bucket"] == sample_experiment.s3_bucket
-        assert payload["experiment"]["s3_prefix"] == sample_experiment.s3_prefix
-        assert payload["experiment"]["filenames"] == sample_experiment.filenames
-        assert (
-            payload["experiment"]["experiment_design"]
-            == sample_experiment.experiment_design.data
-        )
-        assert (
-            payload["experiment"]["sample_metadata"]
-            == sample_experiment.sample_metadata.data
-        )
-
-    def test_create_success_200_status(
-        self, experiments_resource, sample_experiment, sample_api_response, mock_client
-    ):
-        """Test successful experiment creation with 200 status code"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = sample_api_response
-
-        mock_client._make_request.return_value = mock_response
-
-        result = experiments_resource.create(sample_experiment)
+        assert result == _EXPERIMENT_ID
 
-        assert result == "1234567890abcdef1234567890abcdef"
+        assert mock_client._make_request.call_count == 1
+        assert mock_client._make_request.call_args.kwargs == {
+            "method": "POST",
+            "endpoint": "/experiments",
+            "json": _EXPECTED_CREATE_PAYLOAD,
+            "headers": {"Content-Type": "application/json"},
+        }
 
     def test_create_failure(self, experiments_resource, sample_experiment, mock_client):
         """Test experiment creation failure"""
-        mock_response = Mock()
-        mock_response.status_code = 400
-        mock_response.text = "Bad Request: Invalid experiment data"
+        mock_response = _response(400, text="Bad Request: Invalid experiment data")
 
         mock_client._make_request.return_value = mock_response
 
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(
+            Exception,
+            match=re.escape(
+                "Failed to create experiment: 400 - Bad Request: Invalid experiment data"
+            ),
+        ):
             experiments_resource.create(sample_experiment)
 
-        assert (
-            "Failed to create experiment: 400 - Bad Request: Invalid experiment data"
-            in str(exc_info.value)
-        )
-
     def test_create_with_minimal_experiment(self, experiments_resource, mock_client):
         """Test experiment creation with minimal required fields"""
         minimal_experiment = Experiment(
@@ -160,9 +263,7 @@ class TestExperiments:
             filenames=[],
         )
 
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {"id": "abcdef1234567890abcdef1234567890"}
+        mock_response = _response(201, json={"id": "abcdef1234567890abcdef1234567890"})
 
         mock_client._make_request.return_value = mock_response
 
@@ -170,25 +271,23 @@ class TestExperiments:
 
         assert result == "abcdef1234567890abcdef1234567890"
 
-        call_args = mock_client._make_request.call_args
-        payload = call_args[1]["json"]["experiment"]
-
-        assert payload["name"] == "Minimal Experiment"
-        assert payload["source"] == "minimal_source"
-        assert payload["description"] is None
-        assert payload["experiment_design"] is None
-        assert payload["sample_metadata"] is None
+        assert mock_client._make_request.call_args.kwargs["json"] == {
+            "experiment": {
+                "name": "Minimal Experiment",
+                "description": None,
+                "experiment_design": None,
+                "labelling_method": None,
+                "source": "minimal_source",
+                "filenames": [],
+                "sample_metadata": None,
+                "s3_bucket": "minimal-bucket",
+                "s3_prefix": None,
+            }
+        }
 
-    @patch("md_python.uploads.requests.put")
-    @patch("md_python.uploads.os.path.getsize")
-    @patch("md_python.uploads.os.path.exists")
-    @patch("builtins.open", new_callable=mock_open, read_data=b"file content")
     def test_create_with_file_location_and_uploads(
         self,
-        mock_file,
-        mock_exists,
-        mock_getsize,
-        mock_requests_put,
+        upload_patches,
         experiments_resource,
         mock_client,
     ):
@@ -199,33 +298,31 @@ class TestExperiments:
             filenames=["file1.txt", "file2.txt"],
         )
 
-        experiment_id = "075296f0-9d6a-4bf0-8dbb-80074a255359"
-        create_response = Mock()
-        create_response.status_code = 201
-        create_response.json.return_value = {
-            "id": experiment_id,
-            "uploads": [
-                {
-                    "filename": "file1.txt",
-                    "url": "http://example.com/upload/file1.txt",
-                    "mode": "single",
-                },
-                {
-                    "filename": "file2.txt",
-                    "url": "http://example.com/upload/file2.txt",
-                    "mode": "single",
-                },
-            ],
-        }
+        experiment_id = _UPLOAD_EXPERIMENT_ID
+        create_response = _response(
+            201,
+            json={
+                "id": experiment_id,
+                "uploads": [
+                    {
+                        "filename": "file1.txt",
+                        "url": "http://example.com/upload/file1.txt",
+                        "mode": "single",
+                    },
+                    {
+                        "filename": "file2.txt",
+                        "url": "http://example.com/upload/file2.txt",
+                        "mode": "single",
+                    },
+                ],
+            },
+        )
 
-        workflow_response = Mock()
-        workflow_response.status_code = 200
+        workflow_response = _response(200)
 
-        mock_exists.return_value = True
-        mock_getsize.side_effect = [1024, 2048]
-        mock_upload_response = Mock()
-        mock_upload_response.status_code = 200
-        mock_requests_put.return_value = mock_upload_response
+        upload_patches.getsize.side_effect = [1024, 2048]
+        mock_upload_response = _response(200)
+        upload_patches.put.return_value = mock_upload_response
 
         mock_client._make_request.side_effect = [create_response, workflow_response]
 
@@ -233,39 +330,35 @@ class TestExperiments:
 
         assert result == experiment_id
 
-        assert mock_client._make_request.call_count == 2
-
-        create_call = mock_client._make_request.call_args_list[0]
-        assert create_call[1]["method"] == "POST"
-        assert create_call[1]["endpoint"] == "/experiments"
-        payload = create_call[1]["json"]["experiment"]
-        assert payload["file_location"] == "/path/to/files"
-        assert payload["filenames"] == ["file1.txt", "file2.txt"]
-        assert payload["file_sizes"] == [None, None]
-        assert "s3_bucket" not in payload
-        assert "s3_prefix" not in payload
+        create_call, workflow_call = (
+            c.kwargs for c in mock_client._make_request.call_args_list
+        )
+        assert create_call["method"] == "POST"
+        assert create_call["endpoint"] == "/experiments"
+        assert create_call["json"]["experiment"] == {
+            "name": "File Upload Experiment",
+            "description": None,
+            "experiment_design": None,
+            "labelling_method": None,
+            "source": "test_source",
+            "filenames": ["file1.txt", "file2.txt"],
+            "sample_metadata": None,
+            "file_location": "/path/to/files",
+            "file_sizes": [None, None],
+        }
 
-        workflow_call = mock_client._make_request.call_args_list[1]
-        assert workflow_call[1]["method"] == "POST"
+        assert workflow_call["method"] == "POST"
         assert (
-            workflow_call[1]["endpoint"]
-            == f"/experiments/{experiment_id}/start_workflow"
+            workflow_call["endpoint"] == f"/experiments/{experiment_id}/start_workflow"
         )
 
-        assert mock_requests_put.call_count == 2
-        assert mock_exists.call_count == 4
-        assert mock_getsize.call_count == 2
+        assert upload_patches.put.call_count == 2
+        assert upload_patches.exists.call_count == 4
+        assert upload_patches.getsize.call_count == 2
 
-    @patch("md_python.uploads.requests.put")
-    @patch("md_python.uploads.os.path.getsize")
-    @patch("md_python.uploads.os.path.exists")
-    @patch("builtins.open", new_callable=mock_open, read_data=b"file content")
     def test_create_with_multipart_upload(
         self,
-        mock_file,
-        mock_exists,
-        mock_getsize,
-        mock_requests_put,
+        upload_patches,
         experiments_resource,
         mock_client,
     ):
@@ -276,41 +369,37 @@ class TestExperiments:
             filenames=["large_file.d"],
         )
 
-        experiment_id = "075296f0-9d6a-4bf0-8dbb-80074a255359"
-        create_response = Mock()
-        create_response.status_code = 201
-        create_response.json.return_value = {
-            "id": experiment_id,
-            "uploads": [
-                {
-                    "filename": "large_file.d",
-                    "mode": "multipart",
-                    "upload_session_id": "2~abc123def456ghi789",
-                    "parts": [
-                        {
-                            "url": "https://test-bucket.s3.amazonaws.com/upload/large_file.d?partNumber=1",
-                            "part_number": 1,
-                        },
-                        {
-                            "url": "https://test-bucket.s3.amazonaws.com/upload/large_file.d?partNumber=2",
-                            "part_number": 2,
-                        },
-                    ],
-                },
-            ],
-        }
+        experiment_id = _UPLOAD_EXPERIMENT_ID
+        create_response = _response(
+            201,
+            json={
+                "id": experiment_id,
+                "uploads": [
+                    {
+                        "filename": "large_file.d",
+                        "mode": "multipart",
+                        "upload_session_id": "2~abc123def456ghi789",
+                        "parts": [
+                            {
+                                "url": "https://test-bucket.s3.amazonaws.com/upload/large_file.d?partNumber=1",
+                                "part_number": 1,
+                            },
+                            {
+                                "url": "https://test-bucket.s3.amazonaws.com/upload/large_file.d?partNumber=2",
+                                "part_number": 2,
+                            },
+                        ],
+                    },
+                ],
+            },
+        )
 
-        workflow_response = Mock()
-        workflow_response.status_code = 200
-        complete_response = Mock()
-        complete_response.status_code = 200
+        workflow_response = _response(200)
+        complete_response = _response(200)
 
-        mock_exists.return_value = True
-        mock_getsize.return_value = 50_000_000
-        mock_upload_response = Mock()
-        mock_upload_response.status_code = 200
-        mock_upload_response.headers = {"ETag": '"etag123"'}
-        mock_requests_put.return_value = mock_upload_response
+        upload_patches.getsize.return_value = 50_000_000
+        mock_upload_response = _response(200, headers={"ETag": '"etag123"'})
+        upload_patches.put.return_value = mock_upload_response
 
         mock_client._make_request.side_effect = [
             create_response,
@@ -322,503 +411,215 @@ class TestExperiments:
 
         assert result == experiment_id
 
-        assert mock_client._make_request.call_count == 3
-
-        create_call = mock_client._make_request.call_args_list[0]
-        payload = create_call[1]["json"]["experiment"]
-        assert payload["file_sizes"] == [50_000_000]
+        create_call, complete_call, workflow_call = (
+            c.kwargs for c in mock_client._make_request.call_args_list
+        )
+        assert create_call["json"]["experiment"]["file_sizes"] == [50_000_000]
 
-        complete_call = mock_client._make_request.call_args_list[1]
-        assert complete_call[1]["method"] == "POST"
+        assert complete_call["method"] == "POST"
         assert (
-            complete_call[1]["endpoint"]
+            complete_call["endpoint"]
             == f"/experiments/{experiment_id}/uploads/complete"
         )
-        assert complete_call[1]["json"]["filename"] == "large_file.d"
-        assert complete_call[1]["json"]["upload_id"] == "2~abc123def456ghi789"
+        assert complete_call["json"]["filename"] == "large_file.d"
+        assert complete_call["json"]["upload_id"] == "2~abc123def456ghi789"
 
-        workflow_call = mock_client._make_request.call_args_list[2]
         assert (
-            workflow_call[1]["endpoint"]
-            == f"/experiments/{experiment_id}/start_workflow"
+            workflow_call["endpoint"] == f"/experiments/{experiment_id}/start_workflow"
         )
 
-        assert mock_requests_put.call_count == 2
-        assert mock_exists.call_count == 2
-        assert mock_getsize.call_count == 2
-
-    def test_get_by_id_success(
-        self, experiments_resource, sample_experiment_response, mock_client
+        assert upload_patches.put.call_count == 2
+        assert upload_patches.exists.call_count == 2
+        assert upload_patches.getsize.call_count == 2
+
+
+class TestExperimentsGet:
+    """Test cases for Experiments.get_by_id and Experiments.get_by_name"""
+
+    @pytest.mark.parametrize(
+        "operation,arg,response,endpoint,expected",
+        [
+            (
+                "get_by_id",
+                _EXPERIMENT_ID,
+                _SAMPLE_EXPERIMENT_RESPONSE,
+                f"/experiments/{_EXPERIMENT_ID}",
+                _SAMPLE_EXPERIMENT_FIELDS,
+            ),
+            (
+                "get_by_id",
+                "fedcba0987654321fedcba0987654321",
+                _MINIMAL_EXPERIMENT_RESPONSE,
+                "/experiments/fedcba0987654321fedcba0987654321",
+                _MINIMAL_EXPERIMENT_FIELDS,
+            ),
+            (
+                "get_by_id",
+                "a1b2c3d4e5f67890a1b2c3d4e5f67890",
+                {
+                    "id": "a1b2c3d4e5f67890a1b2c3d4e5f67890",
+                    "name": "Complex Experiment",
+                    "source": "complex_source",
+                    "experiment_design": _COMPLEX_DESIGN.data,
+                    "sample_metadata": _COMPLEX_SAMPLE_METADATA.data,
+                },
+                "/experiments/a1b2c3d4e5f67890a1b2c3d4e5f67890",
+                {
+                    "name": "Complex Experiment",
+                    "source": "complex_source",
+                    "experiment_design": _COMPLEX_DESIGN,
+                    "sample_metadata": _COMPLEX_SAMPLE_METADATA,
+                },
+            ),
+            (
+                "get_by_name",
+                "Test Experiment",
+                _SAMPLE_EXPERIMENT_RESPONSE,
+                "/experiments?name=Test Experiment",
+                _SAMPLE_EXPERIMENT_FIELDS,
+            ),
+            (
+                "get_by_name",
+                "Test experiment Yansin",
+                {
+                    "id": "a1b2c3d4-e5f6-7890-abcd-ef1234567890",
+                    "name": "Test experiment Yansin",
+                    "description": "Experiment description",
+                    "labelling_method": "lfq",
+                    "source": "raw",
+                    "status": "processing",
+                },
+                "/experiments?name=Test experiment Yansin",
+                {
+                    "name": "Test experiment Yansin",
+                    "description": "Experiment description",
+                    "labelling_method": "lfq",
+                    "source": "raw",
+                    "status": "processing",
+                },
+            ),
+            (
+                "get_by_name",
+                "Minimal Experiment",
+                _MINIMAL_EXPERIMENT_RESPONSE,
+                "/experiments?name=Minimal Experiment",
+                _MINIMAL_EXPERIMENT_FIELDS,
+            ),
+            (
+                "get_by_name",
+                "",
+                {
+                    "id": "c3d4e5f6-f7f8-9012-cdef-345678901234",
+                    "name": "",
+                    "source": "test_source",
+                },
+                "/experiments?name=",
+                {"name": "", "source": "test_source"},
+            ),
+        ],
+        ids=[
+            "by-id",
+            "by-id-missing-optional-fields",
+            "by-id-complex-metadata",
+            "by-name",
+            "by-name-special-characters",
+            "by-name-minimal-response",
+            "by-name-empty-name",
+        ],
+    )
+    def test_get_success(
+        self,
+        operation,
+        arg,
+        response,
+        endpoint,
+        expected,
+        experiments_resource,
+        mock_client,
     ):
-        """Test successful experiment retrieval by ID"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = sample_experiment_response
+        """Test that each lookup requests its endpoint and parses the Experiment"""
+        mock_client._make_request.return_value = _response(200, json=response)
 
-        mock_client._make_request.return_value = mock_response
-
-        result = experiments_resource.get_by_id("1234567890abcdef1234567890abcdef")
+        result = getattr(experiments_resource, operation)(arg)
 
         assert isinstance(result, Experiment)
-        assert result.name == "Test Experiment"
-        assert result.description == "A test experiment for unit testing"
-        assert result.source == "test_source"
-        assert result.s3_bucket == "test-bucket"
-        assert result.s3_prefix == "experiments/test/"
-        assert result.filenames == ["file1.txt", "file2.txt"]
-        assert result.labelling_method == "manual"
-        assert result.status == "active"
-
-        assert result.experiment_design is not None
-        assert result.experiment_design.data == [
-            ["condition", "replicate"],
-            ["control", "1"],
-            ["treatment", "1"],
-        ]
-
-        assert result.sample_metadata is not None
-        assert result.sample_metadata.data == [
-            ["sample", "condition"],
-            ["sample1", "control"],
-            ["sample2", "treatment"],
-        ]
-
-        mock_client._make_request.assert_called_once_with(
-            method="GET", endpoint="/experiments/1234567890abcdef1234567890abcdef"
-        )
-
-    def test_get_by_id_failure(self, experiments_resource, mock_client):
-        """Test experiment retrieval failure"""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.text = "Experiment not found"
-
-        mock_client._make_request.return_value = mock_response
-
-        with pytest.raises(Exception) as exc_info:
-            experiments_resource.get_by_id("non-existent-id")
-
-        assert "Failed to get experiment: 404 - Experiment not found" in str(
-            exc_info.value
-        )
+        for field, value in expected.items():
+            assert getattr(result, field) == value, field
 
-    def test_get_by_id_with_missing_optional_fields(
-        self, experiments_resource, mock_client
-    ):
-        """Test experiment retrieval with missing optional fields"""
-        minimal_response = {
-            "id": "fedcba0987654321fedcba0987654321",
-            "name": "Minimal Experiment",
-            "source": "minimal_source",
+        assert mock_client._make_request.call_count == 1
+        assert mock_client._make_request.call_args.kwargs == {
+            "method": "GET",
+            "endpoint": endpoint,
         }
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = minimal_response
-
-        mock_client._make_request.return_value = mock_response
-
-        result = experiments_resource.get_by_id("fedcba0987654321fedcba0987654321")
-
-        assert isinstance(result, Experiment)
-        assert result.name == "Minimal Experiment"
-        assert result.source == "minimal_source"
-        assert result.description is None
-        assert result.experiment_design is None
-        assert result.sample_metadata is None
-        assert result.s3_bucket == ""
-        assert result.s3_prefix is None
-        assert result.filenames == []
-        assert result.labelling_method is None
-        assert result.status is None
-        assert result.created_at is None
-
-    def test_get_by_id_with_complex_metadata(self, experiments_resource, mock_client):
-        """Test experiment retrieval with complex metadata structures"""
-        complex_response = {
-            "id": "a1b2c3d4e5f67890a1b2c3d4e5f67890",
-            "name": "Complex Experiment",
-            "source": "complex_source",
-            "experiment_design": [
-                ["sample_id", "condition", "timepoint", "replicate"],
-                ["S001", "control", "0h", "1"],
-                ["S002", "control", "0h", "2"],
-                ["S003", "treatment", "24h", "1"],
-                ["S004", "treatment", "24h", "2"],
-            ],
-            "sample_metadata": [
-                ["sample_id", "patient_id", "age", "gender", "diagnosis"],
-                ["S001", "P001", "45", "F", "healthy"],
-                ["S002", "P002", "52", "M", "healthy"],
-                ["S003", "P003", "38", "F", "disease"],
-                ["S004", "P004", "61", "M", "disease"],
-            ],
-        }
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = complex_response
-
-        mock_client._make_request.return_value = mock_response
-
-        result = experiments_resource.get_by_id("a1b2c3d4e5f67890a1b2c3d4e5f67890")
-
-        assert isinstance(result, Experiment)
-        assert result.name == "Complex Experiment"
-        assert result.source == "complex_source"
-
-        assert result.experiment_design is not None
-        assert len(result.experiment_design.data) == 5
-        assert result.experiment_design.data[0] == [
-            "sample_id",
-            "condition",
-            "timepoint",
-            "replicate",
-        ]
-        assert result.experiment_design.data[1] == ["S001", "control", "0h", "1"]
-
-        assert result.sample_metadata is not None
-        assert len(result.sample_metadata.data) == 5
-        assert result.sample_metadata.data[0] == [
-            "sample_id",
-            "patient_id",
-            "age",
-            "gender",
-            "diagnosis",
-        ]
-        assert result.sample_metadata.data[1] == ["S001", "P001", "45", "F", "healthy"]
-
-    def test_get_by_name_success(
-        self, experiments_resource, sample_experiment_response, mock_client
+    @pytest.mark.parametrize(
+        "operation,args,expected_message",
+        [
+            (
+                "get_by_id",
+                ("non-existent-id",),
+                "Failed to get experiment: 404 - Experiment not found",
+            ),
+            (
+                "get_by_name",
+                ("Non-existent Experiment",),
+                "Failed to get experiment by name: 404 - Experiment not found",
+            ),
+        ],
+        ids=["get_by_id", "get_by_name"],
+    )
+    def test_not_found_failure(
+        self, operation, args, expected_message, experiments_resource, mock_client
     ):
-        """Test successful experiment retrieval by name"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = sample_experiment_response
-
-        mock_client._make_request.return_value = mock_response
-
-        result = experiments_resource.get_by_name("Test Experiment")
-
-        assert isinstance(result, Experiment)
-        assert result.name == "Test Experiment"
-        assert result.description == "A test experiment for unit testing"
-        assert result.source == "test_source"
-        assert result.s3_bucket == "test-bucket"
-        assert result.s3_prefix == "experiments/test/"
-        assert result.filenames == ["file1.txt", "file2.txt"]
-        assert result.labelling_method == "manual"
-        assert result.status == "active"
-
-        assert result.experiment_design is not None
-        assert result.experiment_design.data == [
-            ["condition", "replicate"],
-            ["control", "1"],
-            ["treatment", "1"],
-        ]
-
-        assert result.sample_metadata is not None
-        assert result.sample_metadata.data == [
-            ["sample", "condition"],
-            ["sample1", "control"],
-            ["sample2", "treatment"],
-        ]
-
-        mock_client._make_request.assert_called_once_with(
-            method="GET", endpoint="/experiments?name=Test Experiment"
+        """Test that a 404 from each lookup raises with its message"""
+        mock_client._make_request.return_value = _response(
+            404, text="Experiment not found"
         )
 
-    def test_get_by_name_failure(self, experiments_resource, mock_client):
-        """Test experiment retrieval by name failure"""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.text = "Experiment not found"
-
-        mock_client._make_request.return_value = mock_response
+        with pytest.raises(Exception, match=re.escape(expected_message)):
+            getattr(experiments_resource, operation)(*args)
 
-        with pytest.raises(Exception) as exc_info:
-            experiments_resource.get_by_name("Non-existent Experiment")
 
-        assert "Failed to get experiment by name: 404 - Experiment not found" in str(
-            exc_info.value
-        )
+class TestExperimentsUpdateMetadata:
+    """Test cases for Experiments.update_sample_metadata"""
 
-    def test_get_by_name_with_special_characters(
-        self, experiments_resource, mock_client
+    @pytest.mark.parametrize(
+        "sample_metadata",
+        [_DOSE_METADATA, SampleMetadata(data=[]), _COMPLEX_METADATA, _SPECIAL_METADATA],
+        ids=["dose", "empty", "complex", "special-characters"],
+    )
+    def test_update_sample_metadata_success(
+        self, sample_metadata, experiments_resource, mock_client
     ):
-        """Test experiment retrieval by name with special characters and spaces"""
-        special_name_response = {
-            "id": "a1b2c3d4-e5f6-7890-abcd-ef1234567890",
-            "name": "Test experiment Yansin",
-            "description": "Experiment description",
-            "labelling_method": "lfq",
-            "source": "raw",
-            "status": "processing",
-        }
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = special_name_response
-
-        mock_client._make_request.return_value = mock_response
-
-        result = experiments_resource.get_by_name("Test experiment Yansin")
-
-        assert isinstance(result, Experiment)
-        assert result.name == "Test experiment Yansin"
-        assert result.description == "Experiment description"
-        assert result.labelling_method == "lfq"
-        assert result.source == "raw"
-        assert result.status == "processing"
-
-        mock_client._make_request.assert_called_once_with(
-            method="GET", endpoint="/experiments?name=Test experiment Yansin"
-        )
-
-    def test_get_by_name_with_minimal_response(self, experiments_resource, mock_client):
-        """Test experiment retrieval by name with minimal API response"""
-        minimal_response = {
-            "id": "b2c3d4e5-f6f7-8901-bcde-f23456789012",
-            "name": "Minimal Experiment",
-            "source": "minimal_source",
-        }
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = minimal_response
-
-        mock_client._make_request.return_value = mock_response
-
-        result = experiments_resource.get_by_name("Minimal Experiment")
-
-        assert isinstance(result, Experiment)
-        assert result.name == "Minimal Experiment"
-        assert result.source == "minimal_source"
-        assert result.description is None
-        assert result.experiment_design is None
-        assert result.sample_metadata is None
-        assert result.s3_bucket == ""
-        assert result.s3_prefix is None
-        assert result.filenames == []
-        assert result.labelling_method is None
-        assert result.status is None
-        assert result.created_at is None
-
-    def test_get_by_name_with_empty_name(self, experiments_resource, mock_client):
-        """Test experiment retrieval by name with empty string"""
-        empty_name_response = {
-            "id": "c3d4e5f6-f7f8-9012-cdef-345678901234",
-            "name": "",
-            "source": "test_source",
-        }
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = empty_name_response
-
-        mock_client._make_request.return_value = mock_response
-
-        result = experiments_resource.get_by_name("")
-
-        assert isinstance(result, Experiment)
-        assert result.name == ""
-        assert result.source == "test_source"
-
-        mock_client._make_request.assert_called_once_with(
-            method="GET", endpoint="/experiments?name="
-        )
-
-    def test_update_sample_metadata_success(self, experiments_resource, mock_client):
-        """Test successful sample metadata update"""
-        sample_metadata = SampleMetadata(
-            data=[
-                ["sample_name", "dose"],
-                ["1", "1"],
-                ["2", "20"],
-                ["3", "30"],
-                ["4", "40"],
-                ["5", "50"],
-                ["6", "60"],
-            ]
-        )
-
+        """Test that sample metadata is sent unchanged with the v1 JSON headers"""
         experiment_id = "9022c4b9-f929-4be2-8483-9b2dcb1e76c2"
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = "OK"
-
-        mock_client._make_request.return_value = mock_response
+        mock_client._make_request.return_value = _response(200, text="OK")
 
         result = experiments_resource.update_sample_metadata(
             experiment_id=experiment_id, sample_metadata=sample_metadata
         )
 
         assert result is True
-
-        mock_client._make_request.assert_called_once()
-        call_args = mock_client._make_request.call_args
-
-        assert call_args[1]["method"] == "PUT"
-        assert (
-            call_args[1]["endpoint"] == f"/experiments/{experiment_id}/sample_metadata"
-        )
-        assert call_args[1]["headers"] == {
-            "Content-Type": "application/json",
-            "accept": "application/vnd.md-v1+json",
+        assert mock_client._make_request.call_count == 1
+        assert mock_client._make_request.call_args.kwargs == {
+            "method": "PUT",
+            "endpoint": f"/experiments/{experiment_id}/sample_metadata",
+            "json": {"sample_metadata": sample_metadata.data},
+            "headers": _JSON_MD_HEADERS,
         }
 
-        payload = call_args[1]["json"]
-        assert "sample_metadata" in payload
-        assert payload["sample_metadata"] == sample_metadata.data
-
-    def test_update_sample_metadata_failure(self, experiments_resource, mock_client):
-        """Test sample metadata update failure"""
-        sample_metadata = SampleMetadata(data=[["sample_name", "dose"], ["1", "1"]])
-
-        experiment_id = "invalid-experiment-id"
-
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.text = "Experiment not found"
-
-        mock_client._make_request.return_value = mock_response
+    def test_update_sample_metadata_not_found(self, experiments_resource, mock_client):
+        """Test that a 404 from the update raises with its message"""
+        mock_client._make_request.return_value = _response(
+            404, text="Experiment not found"
+        )
 
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(
+            Exception,
+            match=re.escape(
+                "Failed to update sample metadata: 404 - Experiment not found"
+            ),
+        ):
             experiments_resource.update_sample_metadata(
-                experiment_id=experiment_id, sample_metadata=sample_metadata
+                "invalid-experiment-id", _BASIC_METADATA
             )
-
-        assert "Failed to update sample metadata: 404 - Experiment not found" in str(
-            exc_info.value
-        )
-
-    def test_update_sample_metadata_with_empty_metadata(
-        self, experiments_resource, mock_client
-    ):
-        """Test sample metadata update with empty metadata"""
-        empty_metadata = SampleMetadata(data=[])
-
-        experiment_id = "9022c4b9-f929-4be2-8483-9b2dcb1e76c2"
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = "OK"
-
-        mock_client._make_request.return_value = mock_response
-
-        result = experiments_resource.update_sample_metadata(
-            experiment_id=experiment_id, sample_metadata=empty_metadata
-        )
-
-        assert result is True
-
-        call_args = mock_client._make_request.call_args
-        payload = call_args[1]["json"]
-        assert payload["sample_metadata"] == []
-
-    def test_update_sample_metadata_with_complex_metadata(
-        self, experiments_resource, mock_client
-    ):
-        """Test sample metadata update with complex metadata structure"""
-        complex_metadata = SampleMetadata(
-            data=[
-                [
-                    "sample_id",
-                    "patient_id",
-                    "age",
-                    "gender",
-                    "diagnosis",
-                    "treatment_group",
-                ],
-                ["S001", "P001", "45", "F", "healthy", "control"],
-                ["S002", "P002", "52", "M", "healthy", "control"],
-                ["S003", "P003", "38", "F", "disease", "treatment"],
-                ["S004", "P004", "61", "M", "disease", "treatment"],
-            ]
-        )
-
-        experiment_id = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = "OK"
-
-        mock_client._make_request.return_value = mock_response
-
-        result = experiments_resource.update_sample_metadata(
-            experiment_id=experiment_id, sample_metadata=complex_metadata
-        )
-
-        assert result is True
-
-        call_args = mock_client._make_request.call_args
-        payload = call_args[1]["json"]
-        assert payload["sample_metadata"] == complex_metadata.data
-        assert len(payload["sample_metadata"]) == 5
-        assert payload["sample_metadata"][0] == [
-            "sample_id",
-            "patient_id",
-            "age",
-            "gender",
-            "diagnosis",
-            "treatment_group",
-        ]
-
-    def test_update_sample_metadata_with_special_characters(
-        self, experiments_resource, mock_client
-    ):
-        """Test sample metadata update with special characters in data"""
-        special_metadata = SampleMetadata(
-            data=[
-                ["sample_name", "description", "notes"],
-                ["sample_1", "Control sample", "Normal condition"],
-                ["sample_2", "Treatment sample", "High dose (50mg/kg)"],
-                ["sample_3", "Special sample", "Contains: NaCl, H2O, pH=7.4"],
-            ]
-        )
-
-        experiment_id = "b2c3d4e5-f6f7-8901-bcde-f23456789012"
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = "OK"
-
-        mock_client._make_request.return_value = mock_response
-
-        result = experiments_resource.update_sample_metadata(
-            experiment_id=experiment_id, sample_metadata=special_metadata
-        )
-
-        assert result is True
-
-        call_args = mock_client._make_request.call_args
-        payload = call_args[1]["json"]
-        assert payload["sample_metadata"] == special_metadata.data
-        assert "High dose (50mg/kg)" in payload["sample_metadata"][2]
-        assert "Contains: NaCl, H2O, pH=7.4" in payload["sample_metadata"][3]
-
-    def test_update_sample_metadata_headers_verification(
-        self, experiments_resource, mock_client
-    ):
-        """Test that correct headers are sent in the request"""
-        sample_metadata = SampleMetadata(data=[["sample_name", "dose"], ["1", "1"]])
-
-        experiment_id = "test-experiment-id"
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = "OK"
-
-        mock_client._make_request.return_value = mock_response
-
-        experiments_resource.update_sample_metadata(
-            experiment_id=experiment_id, sample_metadata=sample_metadata
-        )
-
-        call_args = mock_client._make_request.call_args
-        headers = call_args[1]["headers"]
-
-        assert headers["Content-Type"] == "application/json"
-        assert headers["accept"] == "application/vnd.md-v1+json"
-        assert len(headers) == 2
@@ -1,32 +1,38 @@
+import copy
+
 import pytest
 
-from md_python.client import MDClientV1 as MDClient
 from md_python.models import Experiment
-from md_python.resources.experiments import Experiments
+
+_EXP_PROTO = Experiment(name="x", source="s", s3_bucket="b", filenames=[])
 
 
 def make_exp(status: str) -> Experiment:
-    return Experiment(name="x", source="s", s3_bucket="b", filenames=[], status=status)
+    # Experiment is a pydantic dataclass with no model_copy; a shallow copy of
+    # a validated prototype skips re-validating the unchanged fields
+    exp = copy.copy(_EXP_PROTO)
+    exp.status = status
+    return exp
 
 
 class TestExperimentsWait:
     @pytest.fixture
-    def mock_client(self, mocker):
-        return mocker.Mock(spec=MDClient)
-
-    @pytest.fixture
-    def res(self, mock_client):
-        return Experiments(mock_client)
+    def res(self, experiments_resource):
+        return experiments_resource
 
     def test_wait_until_complete_success(self, res, mocker):
+        # freeze the clock and skip real sleeps so the poll loop runs instantly
+        sleep = mocker.patch("md_python.resources.experiments.time.sleep")
+        mocker.patch("md_python.resources.experiments.time.monotonic", return_value=0.0)
         mocker.patch.object(
             res,
             "get_by_id",
             side_effect=[make_exp("PROCESSING"), make_exp("COMPLETED")],
         )
-        out = res.wait_until_complete("exp-1", poll_s=0, timeout_s=2)
+        out = res.wait_until_complete("exp-1", poll_s=5, timeout_s=2)
         assert isinstance(out, Experiment)
         assert out.status == "COMPLETED"
+        sleep.assert_called_once_with(5)
 
     def test_wait_until_complete_failure(self, res, mocker):
         mocker.patch.object(res, "get_by_id", return_value=make_exp("FAILED"))
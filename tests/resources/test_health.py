@@ -1,41 +1,52 @@
+import inspect
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
 
-from md_python.client import MDClientV1 as MDClient
 from md_python.resources.health import Health
 
+# resolved once on import rather than in the test body
+_CHECK_SIG = inspect.signature(Health.check)
+_CHECK_RETURN = str(_CHECK_SIG.return_annotation)
+
+
+def _response(status_code, json=None):
+    """Plain stand-in for a successful requests.Response as read by Health"""
+    return SimpleNamespace(
+        status_code=status_code, json=lambda: json, raise_for_status=lambda: None
+    )
+
+
+@pytest.fixture(scope="module")
+def _base_health_resource(_base_mock_client):
+    return Health(_base_mock_client)
+
+
+@pytest.fixture(scope="module")
+def sample_health_response():
+    """Sample API response for health check"""
+    return {
+        "status": "healthy",
+        "timestamp": "2024-01-01T00:00:00Z",
+        "version": "1.0.0",
+        "uptime": 3600,
+    }
+
 
 class TestHealth:
     """Test cases for Health resource"""
 
     @pytest.fixture
-    def mock_client(self):
-        """Create a mock MDClient for testing"""
-        client = Mock(spec=MDClient)
-        return client
-
-    @pytest.fixture
-    def health_resource(self, mock_client):
+    def health_resource(self, _base_health_resource, mock_client):
         """Create Health resource instance with mock client"""
-        return Health(mock_client)
-
-    @pytest.fixture
-    def sample_health_response(self):
-        """Sample API response for health check"""
-        return {
-            "status": "healthy",
-            "timestamp": "2024-01-01T00:00:00Z",
-            "version": "1.0.0",
-            "uptime": 3600,
-        }
+        # depending on mock_client resets the shared client before each test
+        return _base_health_resource
 
     def test_check_success(self, health_resource, sample_health_response, mock_client):
         """Test successful health check"""
         # Mock the API response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = sample_health_response
+        mock_response = _response(200, json=sample_health_response)
 
         mock_client._make_request.return_value = mock_response
 
@@ -51,9 +62,7 @@ class TestHealth:
     def test_check_with_different_status_codes(self, health_resource, mock_client):
         """Test health check with different successful status codes"""
         # Test with 200 status
-        mock_response_200 = Mock()
-        mock_response_200.status_code = 200
-        mock_response_200.json.return_value = {"status": "healthy"}
+        mock_response_200 = _response(200, json={"status": "healthy"})
 
         mock_client._make_request.return_value = mock_response_200
 
@@ -61,83 +70,42 @@ class TestHealth:
         assert result == {"status": "healthy"}
 
         # Test with 204 status (no content)
-        mock_response_204 = Mock()
-        mock_response_204.status_code = 204
-        mock_response_204.json.return_value = {}
+        mock_response_204 = _response(204, json={})
 
         mock_client._make_request.return_value = mock_response_204
 
         result = health_resource.check()
         assert result == {}
 
-    def test_check_with_http_error(self, health_resource, mock_client):
-        """Test health check with HTTP error response"""
-        # Mock the API response with HTTP error
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_response.raise_for_status.side_effect = Exception("Internal Server Error")
-
-        mock_client._make_request.return_value = mock_response
-
-        # Call the check method
-        result = health_resource.check()
-
-        # Verify the result contains error information
-        assert result["status"] == "error"
-        assert "Internal Server Error" in result["message"]
+    @pytest.mark.parametrize(
+        "source,message",
+        [
+            ("request", "Connection refused"),
+            ("request", "Request timeout"),
+            ("raise_for_status", "Internal Server Error"),
+            ("json", "Invalid JSON"),
+        ],
+        ids=["network", "timeout", "http-error", "json-decode"],
+    )
+    def test_check_with_error(self, source, message, health_resource, mock_client):
+        """Test that request, HTTP and JSON errors come back as an error status"""
+        error = Exception(message)
+        if source == "request":
+            mock_client._make_request.side_effect = error
+        else:
+            mock_response = _response(200)
+            setattr(mock_response, source, Mock(side_effect=error))
+            mock_client._make_request.return_value = mock_response
 
-        # Verify the API call was made
-        mock_client._make_request.assert_called_once_with("GET", "/health")
-
-    def test_check_with_network_error(self, health_resource, mock_client):
-        """Test health check with network/connection error"""
-        # Mock the API call to raise a network error
-        mock_client._make_request.side_effect = Exception("Connection refused")
-
-        # Call the check method
         result = health_resource.check()
 
-        # Verify the result contains error information
-        assert result["status"] == "error"
-        assert "Connection refused" in result["message"]
-
-        # Verify the API call was attempted
+        assert result == {"status": "error", "message": message}
         mock_client._make_request.assert_called_once_with("GET", "/health")
 
-    def test_check_with_timeout_error(self, health_resource, mock_client):
-        """Test health check with timeout error"""
-        # Mock the API call to raise a timeout error
-        mock_client._make_request.side_effect = Exception("Request timeout")
-
-        # Call the check method
-        result = health_resource.check()
-
-        # Verify the result contains error information
-        assert result["status"] == "error"
-        assert "Request timeout" in result["message"]
-
-    def test_check_with_json_decode_error(self, health_resource, mock_client):
-        """Test health check with JSON decode error"""
-        # Mock the API response with invalid JSON
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.side_effect = Exception("Invalid JSON")
-
-        mock_client._make_request.return_value = mock_response
-
-        # Call the check method
-        result = health_resource.check()
-
-        # Verify the result contains error information
-        assert result["status"] == "error"
-        assert "Invalid JSON" in result["message"]
-
     def test_check_with_empty_response(self, health_resource, mock_client):
         """Test health check with empty response"""
         # Mock the API response with empty data
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {}
+        mock_response = _response(200, json={})
 
         mock_client._make_request.return_value = mock_response
 
@@ -167,9 +135,7 @@ class TestHealth:
             ],
         }
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = complex_health_response
+        mock_response = _response(200, json=complex_health_response)
 
         mock_client._make_request.return_value = mock_response
 
@@ -189,19 +155,11 @@ class TestHealth:
         health = Health(mock_client)
         assert health._client == mock_client
 
-    def test_check_method_signature(self, health_resource):
+    def test_check_method_signature(self):
         """Test that check method has correct signature and return type"""
-        import inspect
-
-        # Check method signature
-        sig = inspect.signature(health_resource.check)
         # Check that return type contains Dict[str, Any] in any format
-        return_annotation_str = str(sig.return_annotation)
-        assert (
-            "Dict" in return_annotation_str
-            and "str" in return_annotation_str
-            and "Any" in return_annotation_str
-        )
-
-        # Check that method takes no parameters (the self parameter is not counted in inspect.signature)
-        assert len(sig.parameters) == 0
+        assert "Dict" in _CHECK_RETURN and "str" in _CHECK_RETURN
+        assert "Any" in _CHECK_RETURN
+
+        # Check that method takes no parameters besides self
+        assert list(_CHECK_SIG.parameters) == ["self"]
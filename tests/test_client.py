@@ -1,137 +1,149 @@
-from unittest.mock import Mock, patch
+import copy
+from unittest.mock import Mock
 
 import pytest
 import requests
 
 from md_python.client_v1 import MDClientV1 as MDClient
 
+_DEFAULT_BASE_URL = "https://app.massdynamics.com/api"
+_CUSTOM_BASE_URL = "https://custom.example.com/api"
+
+
+@pytest.fixture(scope="module")
+def _session_request(module_mocker):
+    return module_mocker.patch("requests.Session.request")
+
+
+@pytest.fixture
+def mock_request(_session_request):
+    """Session.request patched once per module, reset for each test"""
+    _session_request.reset_mock(return_value=True, side_effect=True)
+    return _session_request
+
+
+@pytest.fixture
+def client(md_client):
+    """Shallow copy of the session-wide client
+
+    Reassigning api_token or base_url only affects the copy's own
+    _get_headers/_make_request calls. The pooled session and the health,
+    experiments and datasets resources are shared with the template, and the
+    resources still send requests through the template. Tests that go through
+    a resource must build their own MDClient.
+    """
+    return copy.copy(md_client)
+
 
 class TestMDClient:
     """Test cases for MDClient class"""
 
-    def test_init(self):
+    def test_init(self, api_token):
         """Test client initialization"""
-        api_token = "test_token_123"
         client = MDClient(api_token)
 
         assert client.api_token == api_token
-        assert client.base_url == "https://app.massdynamics.com/api"
+        assert client.base_url == _DEFAULT_BASE_URL
         assert hasattr(client, "health")
         assert hasattr(client, "experiments")
         assert hasattr(client, "datasets")
 
-    def test_get_headers(self):
+    def test_get_headers(self, client, api_token):
         """Test header generation"""
-        api_token = "test_token_123"
-        client = MDClient(api_token)
-
         headers = client._get_headers()
 
         assert headers["accept"] == "application/vnd.md-v1+json"
         assert headers["Authorization"] == f"Bearer {api_token}"
 
-    @patch("requests.request")
-    def test_make_request_basic(self, mock_request):
-        """Test basic request functionality"""
-        api_token = "test_token_123"
-        client = MDClient(api_token)
-
-        # Mock response
+    @pytest.mark.parametrize(
+        "base_url,method,endpoint,kwargs,expected_url",
+        [
+            pytest.param(
+                None,
+                "GET",
+                "/test-endpoint",
+                {},
+                f"{_DEFAULT_BASE_URL}/test-endpoint",
+                id="basic",
+            ),
+            pytest.param(
+                None,
+                "POST",
+                "/test-endpoint",
+                {"headers": {"Content-Type": "application/json"}},
+                f"{_DEFAULT_BASE_URL}/test-endpoint",
+                id="custom-headers",
+            ),
+            pytest.param(
+                None,
+                "POST",
+                "/test-endpoint",
+                {"json": {"key": "value", "number": 42}},
+                f"{_DEFAULT_BASE_URL}/test-endpoint",
+                id="json",
+            ),
+            pytest.param(
+                None,
+                "GET",
+                "/health",
+                {},
+                f"{_DEFAULT_BASE_URL}/health",
+                id="base-url-formatting",
+            ),
+            pytest.param(
+                _CUSTOM_BASE_URL,
+                "GET",
+                "/test-endpoint",
+                {},
+                f"{_CUSTOM_BASE_URL}/test-endpoint",
+                id="custom-base-url",
+            ),
+        ],
+    )
+    def test_make_request(
+        self, client, mock_request, base_url, method, endpoint, kwargs, expected_url
+    ):
+        """Test the URL, merged headers and json sent by _make_request"""
+        if base_url is not None:
+            client.base_url = base_url
         mock_response = Mock()
-        mock_response.status_code = 200
         mock_request.return_value = mock_response
+        expected_headers = {**client._get_headers(), **kwargs.get("headers", {})}
 
-        # Make request
-        response = client._make_request("GET", "/test-endpoint")
+        response = client._make_request(method, endpoint, **kwargs)
 
-        # Verify request was made correctly
         mock_request.assert_called_once_with(
-            "GET",
-            "https://app.massdynamics.com/api/test-endpoint",
-            headers=client._get_headers(),
-            json=None,
+            method, expected_url, headers=expected_headers, json=kwargs.get("json")
         )
-        assert response == mock_response
-
-    @patch("requests.request")
-    def test_make_request_with_custom_headers(self, mock_request):
-        """Test request with custom headers"""
-        api_token = "test_token_123"
-        client = MDClient(api_token)
-
-        # Mock response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_request.return_value = mock_response
-
-        # Custom headers
-        custom_headers = {"Content-Type": "application/json"}
+        assert response is mock_response
 
-        # Make request
-        response = client._make_request(
-            "POST", "/test-endpoint", headers=custom_headers
-        )
+    def test_make_request_reuses_session(self, client, mock_request, mocker):
+        """Test that consecutive requests share the client's pooled session"""
+        # patched on the instance, so a session created per call would miss it
+        session_request = mocker.patch.object(client._session, "request")
 
-        # Verify headers were merged correctly
-        expected_headers = client._get_headers()
-        expected_headers.update(custom_headers)
+        client._make_request("GET", "/health")
+        client._make_request("GET", "/health")
 
-        mock_request.assert_called_once_with(
-            "POST",
-            "https://app.massdynamics.com/api/test-endpoint",
-            headers=expected_headers,
-            json=None,
-        )
-        assert response == mock_response
+        assert isinstance(client._session, requests.Session)
+        assert session_request.call_count == 2
+        mock_request.assert_not_called()
 
-    @patch("requests.request")
-    def test_make_request_with_json(self, mock_request):
-        """Test request with json data"""
-        api_token = "test_token_123"
+    def test_close_releases_session(self, api_token, mocker):
+        """Test that close and the context manager close the pooled session"""
         client = MDClient(api_token)
+        session_close = mocker.patch.object(client._session, "close")
 
-        # Mock response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_request.return_value = mock_response
-
-        # JSON data
-        json_data = {"key": "value", "number": 42}
-
-        # Make request
-        response = client._make_request("POST", "/test-endpoint", json=json_data)
-
-        # Verify json was passed through
-        mock_request.assert_called_once_with(
-            "POST",
-            "https://app.massdynamics.com/api/test-endpoint",
-            headers=client._get_headers(),
-            json=json_data,
-        )
-        assert response == mock_response
-
-    def test_base_url_formatting(self):
-        """Test that base URL is properly formatted"""
-        client = MDClient("test_token")
-
-        # Test endpoint concatenation
-        endpoint = "/health"
-        expected_url = "https://app.massdynamics.com/api/health"
-
-        with patch("requests.request") as mock_request:
-            mock_response = Mock()
-            mock_request.return_value = mock_response
-
-            client._make_request("GET", endpoint)
+        with client as entered:
+            assert entered is client
+        client.close()
 
-            mock_request.assert_called_once_with(
-                "GET", expected_url, headers=client._get_headers(), json=None
-            )
+        assert session_close.call_count == 2
 
-    def test_api_token_in_authorization_header(self):
+    def test_api_token_in_authorization_header(self, client):
         """Test that API token is properly included in Authorization header"""
         api_token = "secret_token_456"
-        client = MDClient(api_token)
+        client.api_token = api_token
 
         headers = client._get_headers()
 
@@ -139,39 +151,12 @@ class TestMDClient:
         assert headers["Authorization"] == f"Bearer {api_token}"
         assert api_token in headers["Authorization"]
 
-    def test_custom_base_url(self):
+    def test_custom_base_url(self, api_token):
         """Test that client can be initialized with a custom base URL"""
-        api_token = "test_token_123"
-        custom_base_url = "https://custom.example.com/api"
-
-        client = MDClient(api_token, base_url=custom_base_url)
+        client = MDClient(api_token, base_url=_CUSTOM_BASE_URL)
 
         assert client.api_token == api_token
-        assert client.base_url == custom_base_url
+        assert client.base_url == _CUSTOM_BASE_URL
         assert hasattr(client, "health")
         assert hasattr(client, "experiments")
         assert hasattr(client, "datasets")
-
-    @patch("requests.request")
-    def test_custom_base_url_request(self, mock_request):
-        """Test that requests use the custom base URL when provided"""
-        api_token = "test_token_123"
-        custom_base_url = "https://custom.example.com/api"
-        client = MDClient(api_token, base_url=custom_base_url)
-
-        # Mock response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_request.return_value = mock_response
-
-        # Make request
-        response = client._make_request("GET", "/test-endpoint")
-
-        # Verify request was made with custom base URL
-        mock_request.assert_called_once_with(
-            "GET",
-            f"{custom_base_url}/test-endpoint",
-            headers=client._get_headers(),
-            json=None,
-        )
-        assert response == mock_response